@@ -444,9 +444,10 @@ class GameLoop:
                 self.systems.hud_menu.render(self.systems.renderer.screen, self.state.width, self.state.height)
             if self.systems.activity_log_menu:
                 self.systems.activity_log_menu.render(self.systems.renderer.screen, self.state.width, self.state.height)
-            if self.systems.inventory_menu:
+            # Overlay menus are hidden for most frames, so skip the call entirely
+            if self.systems.inventory_menu and self.systems.inventory_menu.is_visible:
                 self.systems.inventory_menu.render(self.systems.renderer.screen, self.state.width, self.state.height)
-            if self.systems.pause_menu:
+            if self.systems.pause_menu and self.systems.pause_menu.is_visible:
                 self.systems.pause_menu.render(self.systems.renderer.screen, self.state.width, self.state.height)
             if self.systems.hand_panel:
                 self.systems.hand_panel.draw()
@@ -14,12 +14,12 @@ class InputHandler:
     Handles all user input for the game.
     
     Processes keyboard and mouse events and converts them into appropriate
-    game actions. Manages key repeating, mouse dragging, and camera control.
+    game actions. Manages mouse dragging and camera control; held movement
+    keys repeat through pygame's key repeat.
     
     Attributes:
         zone: The current game zone being handled
         renderer: The game's rendering system
-        pressed_keys (dict): Currently pressed keys and their timestamps
         is_dragging (bool): Whether the user is currently dragging the view
         manual_camera_control (bool): Whether the camera is under manual control
         key_repeat_delay (int): Milliseconds before key repeat begins
@@ -37,7 +37,6 @@ class InputHandler:
         """
         self.zone = zone
         self.renderer = renderer
-        self.pressed_keys = {}
         self.key_repeat_delay = 200
         self.key_repeat_rate = 50
         
@@ -51,6 +50,15 @@ class InputHandler:
         self.turn_manager = TurnManager.get_instance()
 
         self.event_manager = event_manager
+        
+        # Event type -> handler; each handler returns True if the game should quit
+        self._dispatch = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+        }
 
     def handle_input(self) -> bool:
         """
@@ -59,46 +67,55 @@ class InputHandler:
         Returns:
             bool: True if the game should quit, False otherwise
         """
-        current_time = pygame.time.get_ticks()
         quit_game = False
         
+        # Fetching by type would regroup the events (e.g. a drag's button-up
+        # ahead of its motion), so take them in order and skip unhandled types
+        dispatch = self._dispatch
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.event_manager.emit(GameEventType.GAME_QUIT)
+            handler = dispatch.get(event.type)
+            if handler and handler(event):
                 quit_game = True
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.event_manager.emit(GameEventType.GAME_QUIT)
-                    quit_game = True
-                else:
-                    self._handle_movement(event.key)
-                    self.pressed_keys[event.key] = current_time
-            elif event.type == pygame.KEYUP:
-                if event.key in self.pressed_keys:
-                    del self.pressed_keys[event.key]
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    self._handle_mouse_click(event.pos)
-                elif event.button == 3:  # Right click
-                    self.is_dragging = True
-                    self.last_mouse_pos = event.pos
-                    self.manual_camera_control = True
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 3:  # Right click release
-                    self.is_dragging = False
-                    self.last_mouse_pos = None
-            elif event.type == pygame.MOUSEMOTION:
-                if self.is_dragging and self.last_mouse_pos:
-                    dx = self.last_mouse_pos[0] - event.pos[0]
-                    dy = self.last_mouse_pos[1] - event.pos[1]
-                    self.renderer.camera.move(dx, dy)
-                    self.last_mouse_pos = event.pos
 
-        self._handle_key_repeats(current_time)
         self._handle_path_movement()
         
         return quit_game
 
+    def _on_quit(self, event) -> bool:
+        self.event_manager.emit(GameEventType.GAME_QUIT)
+        return True
+
+    def _on_key_down(self, event) -> bool:
+        if event.key == pygame.K_ESCAPE:
+            self.event_manager.emit(GameEventType.GAME_QUIT)
+            return True
+        # Held keys arrive as repeated KEYDOWN events from pygame.key.set_repeat
+        self._handle_movement(event.key)
+        return False
+
+    def _on_mouse_button_down(self, event) -> bool:
+        if event.button == 1:  # Left click
+            self._handle_mouse_click(event.pos)
+        elif event.button == 3:  # Right click
+            self.is_dragging = True
+            self.last_mouse_pos = event.pos
+            self.manual_camera_control = True
+        return False
+
+    def _on_mouse_button_up(self, event) -> bool:
+        if event.button == 3:  # Right click release
+            self.is_dragging = False
+            self.last_mouse_pos = None
+        return False
+
+    def _on_mouse_motion(self, event) -> bool:
+        if self.is_dragging and self.last_mouse_pos:
+            dx = self.last_mouse_pos[0] - event.pos[0]
+            dy = self.last_mouse_pos[1] - event.pos[1]
+            self.renderer.camera.move(dx, dy)
+            self.last_mouse_pos = event.pos
+        return False
+
     def _handle_movement(self, key):
         dx, dy = self.zone.player.get_movement_from_key(key)
         if dx != 0 or dy != 0:
@@ -123,15 +140,6 @@ class InputHandler:
         tile_y = (pos[1] + self.renderer.camera.viewport.world_y) // tile_size
         self.zone.player.handle_click(tile_x, tile_y)
 
-    def _handle_key_repeats(self, current_time):
-        for key, start_time in list(self.pressed_keys.items()):
-            elapsed = current_time - start_time
-            if elapsed > self.key_repeat_delay:
-                repeats = (elapsed - self.key_repeat_delay) // self.key_repeat_rate
-                if repeats > 0:
-                    self._handle_movement(key)
-                    self.pressed_keys[key] = current_time - (elapsed % self.key_repeat_rate)
-
     def _handle_path_movement(self) -> None:
         """Handle movement along a pre-calculated path."""
         if not self.zone.player:
@@ -0,0 +1,19 @@
+"""Batched blitting helpers shared by the UI panels."""
+
+import pygame
+
+# Surface.fblits only exists in pygame-ce; plain pygame falls back to Surface.blits
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+def blit_batch(surface: pygame.Surface, blit_seq: list) -> None:
+    """
+    Blit a sequence of (source, dest) pairs onto a surface in a single call.
+    
+    Args:
+        surface: The surface to draw onto
+        blit_seq: (source surface, destination) pairs, drawn in order
+    """
+    if HAS_FBLITS:
+        surface.fblits(blit_seq)
+    else:
+        surface.blits(blit_seq, doreturn=False)
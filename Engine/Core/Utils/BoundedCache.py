@@ -0,0 +1,60 @@
+"""Size-bounded cache shared by the UI text, log wrapping and pathfinding caches."""
+
+from typing import Any, Hashable, Optional
+
+class BoundedCache:
+    """
+    A dict-backed cache that holds at most max_size entries.
+
+    When full, adding a new key evicts the oldest entry first. Dicts keep
+    insertion order, so the oldest entry is always the first key.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+        """
+        self.max_size = max_size
+        self._entries: dict = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+            The cached value, or default if absent
+        """
+        return self._entries.get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the oldest entry if the cache is full.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        entries = self._entries
+        if key not in entries and len(entries) >= self.max_size:
+            del entries[next(iter(entries))]
+        entries[key] = value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
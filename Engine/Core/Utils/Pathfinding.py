@@ -5,6 +5,7 @@ import math
 import logging
 from typing import List, Dict, Tuple, Callable
 from Engine.Core.Utils.Position import Position
+from Engine.Core.Utils.BoundedCache import BoundedCache
 
 def manhattan_distance(a: Position, b: Position) -> int:
     """
@@ -14,6 +15,9 @@ def manhattan_distance(a: Position, b: Position) -> int:
 
 class PathFinder:
     _instance = None
+    
+    # Maximum number of cached paths; the oldest entry is evicted first
+    PATH_CACHE_SIZE = 64
 
     def __new__(cls):
         if cls._instance is None:
@@ -24,6 +28,8 @@ class PathFinder:
     def __init__(self):
         if not self._initialized:
             self.zone = None
+            # Paths keyed by (start, goal, entity id, zone map version)
+            self._path_cache = BoundedCache(self.PATH_CACHE_SIZE)
             self.logger = logging.getLogger(__name__)
             self._initialized = True
 
@@ -36,6 +42,7 @@ class PathFinder:
     def set_zone(self, zone):
         """Set the zone reference for pathfinding checks"""
         self.zone = zone
+        self._path_cache.clear()
 
     def is_passable(self, x: int, y: int, entity) -> bool:
         """Delegate passability check to zone"""
@@ -61,6 +68,21 @@ class PathFinder:
             self.logger.warning("Attempting to find path with no zone set")
             return []
 
+        # Passability only changes with the zone's map version, so a repeated
+        # request in the same state gets the same path. Keying on id(entity) is
+        # safe even though ids are reused after an entity is freed: a new entity
+        # only paths once it is added to the zone, which bumps the version, so
+        # it can never match an entry cached for the old one.
+        key = (start.x, start.y, goal.x, goal.y, id(entity), self.zone.map_version)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._search(start, goal, entity)
+            self._path_cache.put(key, path)
+        # Callers consume their path as they walk it, so hand out a copy
+        return list(path)
+
+    def _search(self, start: Position, goal: Position, entity) -> List[Position]:
+        """Run A* from start to goal for the given entity"""
         # Log the pathfinding request
         self.logger.debug(f"Finding path from {start} to {goal} for {entity}")
         
@@ -14,6 +14,8 @@ class Position:
         y (int): Y coordinate
     """
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: int, y: int):
         """
         Initialize a position with coordinates.
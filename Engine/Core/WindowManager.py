@@ -44,6 +44,7 @@ class WindowManager:
         self.screen = None
         self.current_resolution_index = 0
         self.windowed_resolution_index = 0
+        self._resolution_strs = []
         self.logger = logging.getLogger(__name__)
 
     def set_mode(self, width: int, height: int, fullscreen: bool = False) -> pygame.Surface:
@@ -239,6 +240,14 @@ class WindowManager:
         width, height = self.resolutions[self.current_resolution_index]
         return f"{width}x{height}"
 
+    def get_resolution_strs(self) -> list[str]:
+        """Get all available resolutions as strings."""
+        # The list only grows (fullscreen may add the monitor size), so the
+        # formatted strings stay valid until the length changes.
+        if len(self._resolution_strs) != len(self.resolutions):
+            self._resolution_strs = [f"{w}x{h}" for w, h in self.resolutions]
+        return self._resolution_strs
+
     def get_current_resolution(self) -> tuple[int, int]:
         """Get current resolution based on fullscreen state."""
         return (self.monitor_width, self.monitor_height) if self.fullscreen else self.resolutions[self.current_resolution_index]
@@ -4,6 +4,7 @@ Main Menu class for handling menu display and interaction.
 
 from typing import Optional, Any, Dict, Set, Tuple, List
 import pygame
+from Engine.Core.Utils.BoundedCache import BoundedCache
 from .MenuItem import MenuItem
 from .MenuTypes import MenuItemType
 import re
@@ -24,6 +25,9 @@ class Menu:
         'scrollbar_handle_drag': (200, 200, 200)
     }
     
+    # Maximum number of rendered text surfaces kept; the oldest entry is evicted first
+    TEXT_CACHE_SIZE = 256
+    
     """
     A menu that can display and handle interaction with multiple menu items.
     
@@ -66,6 +70,12 @@ class Menu:
         self.resizing = False
         self.padding = 10  # Default padding
         
+        # Rendered text keyed by (font id, text, color); changed text gets a new key
+        self._text_cache = BoundedCache(self.TEXT_CACHE_SIZE)
+        
+        # Translucent backgrounds, rebuilt only when their size changes
+        self._background: Optional[pygame.Surface] = None
+        
         # Initialize log width for right-positioned menus
         if position == "right":
             # Get screen size for initial width calculation
@@ -97,6 +107,61 @@ class Menu:
         """Add a menu item to the menu."""
         self.items.append(item)
 
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render text, reusing a cached surface when available.
+        
+        Args:
+            font: Font to render with
+            text: The text to render
+            color: Text color
+            
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._to_display_format(font.render(text, True, color))
+            self._text_cache.put(key, surface)
+        return surface
+
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Convert a surface that will be kept and blitted repeatedly to the display format.
+        
+        Args:
+            surface: Surface with per-pixel alpha, such as rendered text
+            
+        Returns:
+            pygame.Surface: The converted surface, or the original if no display exists yet
+        """
+        if pygame.display.get_surface() is not None:
+            # Match the display format so cached surfaces blit without conversion
+            return surface.convert_alpha()
+        return surface
+
+    def _get_background(self, width: int, height: int, alpha: int) -> pygame.Surface:
+        """
+        Get a translucent black background of the given size.
+        
+        Args:
+            width: Background width
+            height: Background height
+            alpha: Surface alpha
+            
+        Returns:
+            pygame.Surface: The cached background, rebuilt if the size changed
+        """
+        if self._background is None or self._background.get_size() != (width, height):
+            self._background = pygame.Surface((width, height))
+            if pygame.display.get_surface() is not None:
+                self._background = self._background.convert()
+            self._background.fill((0, 0, 0))
+            self._background.set_alpha(alpha)
+        return self._background
+
 
     def update_log_width(self, new_width: int) -> None:
         """
@@ -255,7 +320,7 @@ class Menu:
         """Render a centered menu with title."""
         # Draw title
         if self.title:
-            title_surface = self.font_large.render(self.title, True, (255, 255, 255))
+            title_surface = self._render_text(self.font_large, self.title, (255, 255, 255))
             title_rect = title_surface.get_rect(center=(width // 2, height // 4))
             screen.blit(title_surface, title_rect)
         
@@ -263,7 +328,7 @@ class Menu:
         start_y = height // 2
         for i, item in enumerate(self.items):
             color = (255, 255, 0) if i == self.selected_index else (200, 200, 200)
-            text_surface = self.font_small.render(item.get_display_text(), True, color)
+            text_surface = self._render_text(self.font_small, item.get_display_text(), color)
             pos = (width // 2, start_y + i * 40)
             rect = text_surface.get_rect(center=pos)
             screen.blit(text_surface, rect)
@@ -281,9 +346,7 @@ class Menu:
         bar_height = 30  # Height of the black background bar
         
         # Draw black background bar across the screen
-        bar_surface = pygame.Surface((width, bar_height))
-        bar_surface.fill((0, 0, 0))
-        bar_surface.set_alpha(200)  # Make it slightly transparent
+        bar_surface = self._get_background(width, bar_height, 200)  # Slightly transparent
         screen.blit(bar_surface, (0, 0))
         
         # Draw HUD items
@@ -291,7 +354,7 @@ class Menu:
         y = (bar_height - self.font_small.get_height()) // 2  # Center text vertically in bar
         
         for item in self.items:
-            text_surface = self.font_small.render(item.get_display_text(), True, (255, 255, 255))
+            text_surface = self._render_text(self.font_small, item.get_display_text(), (255, 255, 255))
             screen.blit(text_surface, (x, y))
             x += text_surface.get_width() + padding  # Space items horizontally
             
@@ -326,9 +389,7 @@ class Menu:
             self._resize_handle_rect = pygame.Rect(x, y, handle_width, log_height)
             
             # Draw semi-transparent background
-            log_surface = pygame.Surface((self.log_width, log_height))
-            log_surface.fill((0, 0, 0))
-            log_surface.set_alpha(180)
+            log_surface = self._get_background(self.log_width, log_height, 180)
             screen.blit(log_surface, (x, y))
             
             # Draw resize handle
@@ -338,7 +399,7 @@ class Menu:
             # Draw title if present
             title_y = y + padding
             if self.title:
-                title_surface = self.font_small.render(self.title, True, (255, 255, 255))
+                title_surface = self._render_text(self.font_small, self.title, (255, 255, 255))
                 title_rect = title_surface.get_rect(midtop=(x + self.log_width//2, y + padding))
                 screen.blit(title_surface, title_rect)
                 title_y = title_rect.bottom + padding
@@ -351,13 +412,10 @@ class Menu:
             for item in self.items:
                 if item.type == MenuItemType.LOG:
                     try:
-                        # Get the formatted text from the menu item
-                        text = item.get_display_text()
-                        if not text:
-                            continue
-                            
-                        # Split into lines and handle color markup
-                        lines = text.splitlines()
+                        # Get the formatted lines from the menu item
+                        lines = item.get_display_lines()
+                        
+                        # Render each line, handling color markup
                         for line in lines:
                             if current_y >= self._log_rect.bottom - padding:
                                 break
@@ -371,7 +429,7 @@ class Menu:
                                 color = self.COLORS.get(color_name, color)
                                 
                             # Render the line
-                            text_surface = self.font_small.render(line, True, color)
+                            text_surface = self._render_text(self.font_small, line, color)
                             screen.blit(text_surface, (x + padding + handle_width, current_y))
                             current_y += self.font_small.get_height() + 2  # Small spacing between lines
                             
@@ -383,7 +441,7 @@ class Menu:
                         break
                     try:
                         text = item.get_display_text()
-                        text_surface = self.font_small.render(text, True, (255, 255, 255))
+                        text_surface = self._render_text(self.font_small, text, (255, 255, 255))
                         screen.blit(text_surface, (x + padding + handle_width, current_y))
                         current_y += self.font_small.get_height() + 5
                     except Exception as e:
@@ -85,6 +85,17 @@ class MenuItem:
             return self.value_getter.get_display_text()
         return self.text
         
+    def get_display_lines(self) -> list[str]:
+        """
+        Get the text to display for this menu item as separate lines.
+        
+        LOG items hand back their message lines directly, so callers don't
+        have to split the joined display text again.
+        """
+        if self.type == MenuItemType.LOG and hasattr(self.value_getter, 'get_messages'):
+            return self.value_getter.get_messages()
+        return self.get_display_text().splitlines()
+        
     @property
     def scroll_offset(self) -> int:
         """Get scroll offset for LOG type items that support scrolling."""
@@ -53,6 +53,7 @@ class InventoryManager:
         self.cards: Dict[int, CardStack] = {}  # Changed to use integer keys
         self._active_cards: List[int] = []  # Changed to use integer IDs
         self.max_active_cards = 5
+        self.version = 0  # Bumped whenever the set of card stacks changes
         
         # Load card templates first
         self.card_templates = CardLoader.load_cards()
@@ -92,6 +93,7 @@ class InventoryManager:
         If the file doesn't exist, start with an empty inventory.
         """
         self.cards.clear()
+        self.version += 1
         
         if not self.inventory_path.exists():
             return
@@ -142,6 +144,7 @@ class InventoryManager:
             return True
             
         self.cards[card.id] = CardStack(card, quantity)
+        self.version += 1
         self.save_inventory()
         return True
         
@@ -166,6 +169,7 @@ class InventoryManager:
         stack.quantity -= quantity
         if stack.quantity == 0:
             del self.cards[card_id]
+            self.version += 1
             # Remove from active cards if it was active
             if card_id in self._active_cards:
                 self._active_cards.remove(card_id)
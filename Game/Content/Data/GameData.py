@@ -2,7 +2,7 @@
 
 import csv
 from pathlib import Path
-from typing import Dict, NamedTuple
+from typing import Dict, Iterable, NamedTuple, Tuple
 import logging
 
 class EntityStats(NamedTuple):
@@ -73,3 +73,18 @@ class GameData:
         self.logger.debug(f"Checking disposition {faction} -> {other}: direct={direct}, reverse={reverse}")
         # Return the more hostile (lower) disposition
         return min(direct, reverse)
+
+    def modify_faction_dispositions(self, deltas: Iterable[Tuple[str, str, int]]) -> None:
+        """
+        Apply several disposition changes in one pass, clamped to [-100, 100].
+        
+        Args:
+            deltas: (faction, other_faction, amount) tuples, e.g. every pair touched by a quest outcome
+        """
+        relations = self._relations
+        updated = 0
+        for faction, other, amount in deltas:
+            faction_relations = relations.setdefault(faction, {})
+            faction_relations[other] = max(-100, min(100, faction_relations.get(other, 0) + amount))
+            updated += 1
+        self.logger.debug("Updated %d faction relations", updated)
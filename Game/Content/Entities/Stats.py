@@ -15,6 +15,12 @@ class Stats:
         strength (int): Physical power, affects melee damage
     """
     
+    # Stats are read in the turn loop for every entity; slots keep attribute access cheap
+    __slots__ = (
+        'quickness', 'max_action_points', 'action_points', 'max_hp', 'current_hp',
+        'strength', 'logger', 'move_cost', 'attack_cost', 'skill_cost'
+    )
+    
     def __init__(self, quickness: int = 100, max_action_points: int = 1000, max_hp: int = 100, strength: int = 10):
         self.quickness = quickness
         self.max_action_points = max_action_points
@@ -33,6 +33,7 @@ class EntityContainer:
         entity_manager (EntityManager): Global entity management system
         turn_manager (TurnManager): Global turn management system
         event_manager (Optional[EventManager]): Event system for entity actions
+        version (int): Incremented whenever an entity is added or moves
         logger (Logger): Logger instance for debugging
     """
     
@@ -49,6 +50,7 @@ class EntityContainer:
         self.entity_manager = EntityManager.get_instance()
         self.turn_manager = TurnManager.get_instance()
         self.event_manager: Optional[EventManager] = None
+        self.version = 0
         self.logger = logging.getLogger(__name__)
         
     def set_event_manager(self, event_manager: EventManager) -> None:
@@ -68,6 +70,7 @@ class EntityContainer:
             entity (Entity): The entity to add to the zone
         """
         self.entities.append(entity)
+        self.version += 1
         if isinstance(entity, Player):
             self._player = entity
             
@@ -157,6 +160,7 @@ class EntityContainer:
             old_pos = Position(entity.position.x, entity.position.y)
             entity.position.x = new_x
             entity.position.y = new_y
+            self.version += 1
             
             # Emit move event
             event_type = GameEventType.PLAYER_MOVED if entity == self.player else GameEventType.ENTITY_MOVED
@@ -43,6 +43,7 @@ class TerrainGrid:
     
     Attributes:
         grid (Grid): The underlying 2D grid of tiles
+        version (int): Incremented whenever a tile changes
         logger (Logger): Logger instance for debugging
     """
     
@@ -55,6 +56,7 @@ class TerrainGrid:
             height (int): Height of the grid in tiles
         """
         self.grid = Grid(width, height)
+        self.version = 0
         self.logger = logging.getLogger(__name__)
         
     def is_in_bounds(self, x: int, y: int) -> bool:
@@ -81,6 +83,7 @@ class TerrainGrid:
         """
         if self.is_in_bounds(x, y):
             self.grid.tiles[y][x] = tile_type
+            self.version += 1
             
     def get_tile(self, x: int, y: int) -> TileType:
         """
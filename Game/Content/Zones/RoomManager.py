@@ -26,6 +26,7 @@ class RoomManager:
         grid (TerrainGrid): The terrain grid to carve rooms into
         rooms (List[Room]): List of all rooms in the zone
         corridors (List[Corridor]): List of all corridors in the zone
+        room_lookup (List[List[int]]): Index into rooms for each tile, -1 outside rooms
         logger (Logger): Logger instance for debugging
     """
     
@@ -39,6 +40,7 @@ class RoomManager:
         self.grid = grid
         self.rooms: List[Room] = []
         self.corridors: List[Corridor] = []
+        self.room_lookup: List[List[int]] = [[-1] * grid.width for _ in range(grid.height)]
         self.logger = logging.getLogger(__name__)
         
     def add_room(self, room: Room) -> None:
@@ -50,6 +52,7 @@ class RoomManager:
         """
         self.rooms.append(room)
         self._carve_room(room)
+        self._index_room(len(self.rooms) - 1)
         
     def add_corridor(self, corridor: Corridor) -> None:
         """
@@ -66,6 +69,9 @@ class RoomManager:
         """
         Get the room containing the given coordinates, if any.
         
+        Uses the precomputed tile lookup, so the cost does not grow with the
+        number of rooms.
+        
         Args:
             x (int): X coordinate to check
             y (int): Y coordinate to check
@@ -73,11 +79,27 @@ class RoomManager:
         Returns:
             Optional[Room]: The room containing the coordinates, or None
         """
-        for room in self.rooms:
-            if (room.position.x <= x < room.position.x + room.width and
-                room.position.y <= y < room.position.y + room.height):
-                return room
-        return None
+        if not self.grid.is_in_bounds(x, y):
+            return None
+        index = self.room_lookup[y][x]
+        return self.rooms[index] if index >= 0 else None
+        
+    def _index_room(self, index: int) -> None:
+        """
+        Record a room's tiles in the room lookup grid.
+        
+        Tiles already claimed by an earlier room keep it, matching the
+        first-match order of the room list.
+        
+        Args:
+            index (int): Index of the room in the rooms list
+        """
+        room = self.rooms[index]
+        for y in range(max(room.position.y, 0), min(room.position.y + room.height, self.grid.height)):
+            row = self.room_lookup[y]
+            for x in range(max(room.position.x, 0), min(room.position.x + room.width, self.grid.width)):
+                if row[x] < 0:
+                    row[x] = index
         
     def _carve_room(self, room: Room) -> None:
         """
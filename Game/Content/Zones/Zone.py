@@ -32,7 +32,7 @@ class Zone:
         grid (TerrainGrid): Terrain and tile management
         entity_container (EntityContainer): Entity and movement management
         room_manager (RoomManager): Room and corridor management
-        pathfinder (PathFinder): Pathfinding system instance
+        pathfinder (PathFinder): Shared pathfinding system, bound when the zone goes live
         logger (Logger): Logger instance for debugging
     """
     
@@ -51,10 +51,6 @@ class Zone:
         self.entity_container = EntityContainer(self.grid)
         self.room_manager = RoomManager(self.grid)
         
-        # Set up pathfinding
-        self.pathfinder = PathFinder.get_instance()
-        self.pathfinder.set_zone(self)
-        
         self.logger.debug("Zone initialized")
         
     def update(self, current_time: int = None) -> None:
@@ -80,6 +76,30 @@ class Zone:
         """
         self.entity_container.set_event_manager(event_manager)
         
+        # The zone is now live; point the shared pathfinder at it
+        self.pathfinder.set_zone(self)
+        
+    @property
+    def pathfinder(self) -> PathFinder:
+        """
+        The shared pathfinding system.
+        
+        It is only pointed at this zone by set_event_manager, so constructing
+        a zone that never goes live (previews, tests) doesn't steal it from
+        the zone being played.
+        """
+        return PathFinder.get_instance()
+        
+    @property
+    def map_version(self) -> tuple[int, int]:
+        """
+        Version of everything that affects passability.
+        
+        Changes whenever a tile is set or an entity is added or moves, so
+        results derived from passability can be cached against it.
+        """
+        return (self.grid.version, self.entity_container.version)
+        
     # Grid delegation
     @property
     def width(self) -> int:
@@ -176,8 +196,10 @@ class Zone:
         Returns:
             list[Entity]: List of entities within the area
         """
+        # Runs every frame for the viewport; read the Rect bounds once, not per entity
+        left, right, top, bottom = area.left, area.right, area.top, area.bottom
         return [
-            entity for entity in self.entities
-            if (area.left <= entity.position.x <= area.right and
-                area.top <= entity.position.y <= area.bottom)
+            entity for entity in self.entity_container.entities
+            if (left <= entity.position.x <= right and
+                top <= entity.position.y <= bottom)
         ] 
\ No newline at end of file
@@ -4,10 +4,13 @@ Turn-based game management system.
 
 import logging
 from Engine.Core.Events import EventManager, GameEventType
-from typing import List, Any, Set
+from typing import List, Any, Set, Dict, Tuple
 
 class TurnManager:
     _instance = None
+    
+    # Side length in tiles of the spatial buckets used to pre-filter visibility candidates
+    VISIBILITY_CELL_SIZE = 8
 
     def __new__(cls):
         if cls._instance is None:
@@ -59,37 +62,78 @@ class TurnManager:
         self.logger.debug(f"Found {len(active_registered)} registered entities")
         
         # Sort entities by quickness and max AP for turn order
-        sorted_entities = sorted(
-            active_registered,
-            key=lambda e: (e.stats.quickness, e.stats.max_action_points),
-            reverse=True
-        )
+        def turn_order(entity: Any) -> tuple:
+            stats = entity.stats
+            return stats.quickness, stats.max_action_points
+        
+        sorted_entities = sorted(active_registered, key=turn_order, reverse=True)
         self.logger.debug(f"Processing entities in order: {[(e.type.name, e.stats.quickness) for e in sorted_entities]}")
         
         # Signal turn start
         self.event_manager.emit(GameEventType.TURN_STARTED, turn_number=self.current_turn)
         
-        # Process each entity's turn
+        # Bucket entities by cell once so visibility checks only scan nearby cells
+        buckets = self._bucket_entities(active_registered)
+        candidate_cache: Dict[Tuple[int, int, int], List[Any]] = {}
+        
+        # Process each entity's turn. ENTITY_TURN handlers run immediately inside
+        # emit(), so turn order is preserved; the events they post (moves, combat,
+        # deaths) only feed UI subscribers and are drained once for the whole turn.
         for entity in sorted_entities:
             self.logger.debug(f"Processing turn for {entity.type.name} (AP: {entity.stats.action_points}, Quickness: {entity.stats.quickness})")
+            candidates = self._get_nearby_entities(entity, buckets, candidate_cache)
             self.event_manager.emit(
                 GameEventType.ENTITY_TURN,
                 entity=entity,
-                visible_entities=self._get_visible_entities(entity, active_registered)
+                visible_entities=self._get_visible_entities(entity, candidates)
             )
-            self.event_manager.process_events()
+        self.event_manager.process_events()
         
         # Signal turn end
         self.logger.debug(f"Ending turn {self.current_turn}")
         self.event_manager.emit(GameEventType.TURN_ENDED, turn_number=self.current_turn)
 
+    def _bucket_entities(self, entities: List[Any]) -> Dict[Tuple[int, int], List[Any]]:
+        """Group entities by the spatial cell containing their position"""
+        cell_size = self.VISIBILITY_CELL_SIZE
+        buckets: Dict[Tuple[int, int], List[Any]] = {}
+        for entity in entities:
+            position = entity.position
+            buckets.setdefault((position.x // cell_size, position.y // cell_size), []).append(entity)
+        return buckets
+
+    def _get_nearby_entities(self, entity: Any, buckets: Dict[Tuple[int, int], List[Any]],
+                             cache: Dict[Tuple[int, int, int], List[Any]]) -> List[Any]:
+        """
+        Collect entities from the cells within the entity's detection range.
+        
+        Entities sharing a cell and reach reuse the same candidate list through
+        the cache. The reach includes one extra tile because entities that acted
+        earlier this turn may have stepped since the buckets were built.
+        """
+        cell_size = self.VISIBILITY_CELL_SIZE
+        cx, cy = entity.position.x // cell_size, entity.position.y // cell_size
+        reach = -(-(entity.detection_range + 1) // cell_size)  # ceil division
+        key = (cx, cy, reach)
+        candidates = cache.get(key)
+        if candidates is None:
+            candidates = [
+                other
+                for dx in range(-reach, reach + 1)
+                for dy in range(-reach, reach + 1)
+                for other in buckets.get((cx + dx, cy + dy), ())
+            ]
+            cache[key] = candidates
+        return candidates
+
     def _get_visible_entities(self, entity: Any, all_entities: List[Any]) -> List[Any]:
         """Get list of entities visible to the given entity"""
-        visible = []
-        for other in all_entities:
-            if other != entity:
-                dx = abs(entity.position.x - other.position.x)
-                dy = abs(entity.position.y - other.position.y)
-                if dx <= entity.detection_range and dy <= entity.detection_range:
-                    visible.append(other)
-        return visible
+        # Hoist the observer's attributes out of the loop; this runs once per entity per turn
+        ex, ey = entity.position.x, entity.position.y
+        detection_range = entity.detection_range
+        return [
+            other for other in all_entities
+            if other is not entity
+            and abs(ex - other.position.x) <= detection_range
+            and abs(ey - other.position.y) <= detection_range
+        ]
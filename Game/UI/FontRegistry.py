@@ -0,0 +1,38 @@
+"""Shared pygame font cache."""
+
+import pygame
+
+class FontRegistry:
+    """
+    Loads each (font path, size) pair once and shares the Font between UI components.
+    
+    Parsing a TTF face is the slow part of building a Font, and panels rebuild
+    their fonts on every window resize. Shared fonts must not have their style
+    (bold, italic, underline) changed by callers.
+    """
+    
+    _cache: dict[tuple[str | None, int], pygame.font.Font] = {}
+    
+    @classmethod
+    def get(cls, path: str | None, size: int) -> pygame.font.Font:
+        """
+        Get the font for a path and size, loading it on first use.
+        
+        Args:
+            path: Font file path, or None for pygame's default font
+            size: Font size in pixels
+            
+        Returns:
+            pygame.font.Font: The shared font instance
+        """
+        key = (path, size)
+        font = cls._cache.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            cls._cache[key] = font
+        return font
+    
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached fonts, e.g. after pygame.font.quit() invalidated them."""
+        cls._cache.clear()
@@ -4,7 +4,11 @@ Implements a simple UI panel for managing the player's active cards and hand.
 
 import pygame
 import logging
+from Engine.Core.Utils.Blitting import blit_batch
+from Engine.Core.Utils.BoundedCache import BoundedCache
+from Game.Content.Cards import Card
 from Game.Content.Cards.DeckManager import DeckManager
+from Game.UI.FontRegistry import FontRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,15 @@ class HandPanel:
     TOOLTIP_COLOR = (30, 30, 30, 240)  # Dark semi-transparent for tooltip
     TOOLTIP_BORDER = (100, 100, 100)  # Light gray for tooltip border
     
+    # Card layout constants (panel-local pixels)
+    CARD_WIDTH = 120
+    CARD_SPACING = 20
+    CARD_TOP = 40
+    CARD_BOTTOM_MARGIN = 10
+    
+    # Maximum number of rendered text surfaces kept; the oldest entry is evicted first
+    TEXT_CACHE_SIZE = 128
+    
     def __init__(self, window_surface: pygame.Surface, deck_manager: DeckManager):
         """
         Initialize the hand panel.
@@ -39,6 +52,17 @@ class HandPanel:
         self.selected_card = None
         self.hovered_card = None  # Track which card is being hovered
         self.tooltip_surface = None  # Surface for the tooltip
+        self._last_mouse_pos = (0, 0)  # Latest MOUSEMOTION position, anchors the tooltip
+        self._text_cache = BoundedCache(self.TEXT_CACHE_SIZE)  # Rendered text keyed by (font id, text, color)
+        self._tooltip_cache: dict[int, pygame.Surface] = {}  # Composed tooltips keyed by card id
+        self._uses_cache: dict[tuple[int, int], pygame.Surface] = {}  # "Uses" text keyed by (current, max)
+        self._dirty = True  # Panel surface must be re-rendered on next draw
+        self._last_state = None  # Deck snapshot the panel surface was rendered from
+        self._card_xs: list[int] = []  # Panel-local left edge of each hand slot
+        self._card_rects: list[pygame.Rect] = []  # Panel-local rect of each hand slot
+        self._card_rects_screen: list[pygame.Rect] = []  # Same rects in window coordinates
+        self._layout_key = None  # (hand size, panel geometry) the layout was built for
+        self._hand_bbox_screen = pygame.Rect(0, 0, 0, 0)  # Window-space extent of all card slots
         
         # Calculate initial activity log width (same formula as Menu class)
         screen_width = window_surface.get_width()
@@ -59,6 +83,7 @@ class HandPanel:
         """Update panel dimensions based on window size."""
         screen_width = self.window_surface.get_width()
         screen_height = self.window_surface.get_height()
+        self._window_size = (screen_width, screen_height)  # Cached for per-frame tooltip placement
         
         # Panel takes up bottom 20% of screen
         self.height = min(int(screen_height * 0.2), 150)  # Cap at 150px
@@ -66,74 +91,204 @@ class HandPanel:
         self.width = screen_width - self.activity_log_width
         self.x = 0
         self.y = screen_height - self.height
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)  # Window-space bounds for event filtering
         
         # Create panel surface
         self.surface = pygame.Surface((self.width, self.height))
         
+        # Pre-render the static background and border, blitted at the start of each draw
+        self._bg_surface = pygame.Surface((self.width, self.height))
+        self._bg_surface.fill(self.PANEL_COLOR)
+        pygame.draw.rect(self._bg_surface, self.BORDER_COLOR, (0, 0, self.width, self.height), 2)
+        self._dirty = True
+        
     def init_fonts(self):
         """Initialize fonts for rendering text."""
         base_size = min(24, max(16, self.height // 6))
-        self.font = pygame.font.Font(None, base_size)
-        self.hotkey_font = pygame.font.Font(None, base_size - 2)  # Slightly smaller for hotkeys
+        font = FontRegistry.get(None, base_size)
+        if font is getattr(self, 'font', None):
+            return  # Same size as before, cached text is still valid
+        self.font = font
+        self.hotkey_font = FontRegistry.get(None, base_size - 2)  # Slightly smaller for hotkeys
+        
+        # Cached surfaces belong to the old fonts
+        self._text_cache.clear()
+        self._tooltip_cache.clear()
+        self._uses_cache.clear()
+        self._hotkey_surfaces = [
+            self._render(str(i + 1), self.hotkey_font, self.HOTKEY_COLOR)
+            for i in range(DeckManager.HAND_SIZE)
+        ]
+        self._dirty = True
+        
+    def _render(self, text: str, font: pygame.font.Font | None = None,
+                color: tuple = TEXT_COLOR) -> pygame.Surface:
+        """
+        Render text, reusing a cached surface when available.
+        
+        Args:
+            text: The text to render
+            font: Font to render with, defaults to the panel font
+            color: Text color
+            
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        font = font or self.font
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self._text_cache.put(key, surface)
+        return surface
+        
+    def _render_uses(self, card: Card) -> pygame.Surface:
+        """
+        Get the "Uses: remaining/max" surface for a card.
         
-    def draw(self):
-        """Draw the hand panel."""
+        Keyed by the card's use counters so the string is only formatted
+        when a (current, max) pair is seen for the first time.
+        """
+        key = (card.current_uses, card.max_uses)
+        surface = self._uses_cache.get(key)
+        if surface is None:
+            surface = self._render(f"Uses: {card.max_uses - card.current_uses}/{card.max_uses}")
+            self._uses_cache[key] = surface
+        return surface
+        
+    def mark_dirty(self):
+        """Force the panel to be re-rendered on the next draw."""
+        self._dirty = True
+        
+    def _get_deck_state(self) -> tuple:
+        """
+        Snapshot the deck state shown by the panel.
+        
+        The deck manager has no change notifications, so this catches mutations
+        made outside the panel (e.g. deck edits from the inventory menu).
+        """
+        return (
+            self.deck_manager.get_card_counts(),
+            tuple((id(card), card.current_uses) for card in self.deck_manager.state.hand),
+            id(self.selected_card)
+        )
+        
+    def draw(self) -> list[pygame.Rect]:
+        """
+        Draw the hand panel, re-rendering it only when its contents changed.
+        
+        Returns:
+            list[pygame.Rect]: Window areas drawn this call, suitable for
+            pygame.display.update() on frames where nothing else changed
+        """
         if not self.is_visible:
-            return
+            return []
+            
+        deck_state = self._get_deck_state()
+        if self._dirty or deck_state != self._last_state:
+            self._render_panel()
+            self._last_state = deck_state
+            self._dirty = False
             
-        # Clear panel
-        self.surface.fill(self.PANEL_COLOR)
-        pygame.draw.rect(self.surface, self.BORDER_COLOR, (0, 0, self.width, self.height), 2)
+        # Draw to window
+        dirty_rects = [self.window_surface.blit(self.surface, (self.x, self.y))]
+        
+        # Draw tooltip if needed
+        if self.hovered_card and self.tooltip_surface:
+            mouse_x, mouse_y = self._last_mouse_pos
+            tooltip_x = min(mouse_x + 10, self._window_size[0] - self.tooltip_surface.get_width())
+            tooltip_y = max(mouse_y - self.tooltip_surface.get_height() - 10, 0)
+            dirty_rects.append(self.window_surface.blit(self.tooltip_surface, (tooltip_x, tooltip_y)))
+            
+        return dirty_rects
+        
+    def _render_panel(self):
+        """Render the pile counts and cards in hand onto the panel surface."""
+        # Clear panel with the pre-rendered background
+        self.surface.blit(self._bg_surface, (0, 0))
         
         # Draw pile counts
         draw_count, discard_count, hand_count = self.deck_manager.get_card_counts()
         counts_text = f"Draw: {draw_count} | Discard: {discard_count}"
-        counts = self.font.render(counts_text, True, self.TEXT_COLOR)
-        self.surface.blit(counts, (10, 10))
-        
-        # Draw cards in hand
-        card_spacing = 20
-        card_width = 120
-        start_x = (self.width - (card_width + card_spacing) * len(self.deck_manager.state.hand)) // 2
+        blit_seq = [(self._render(counts_text), (10, 10))]
         
-        for i, card in enumerate(self.deck_manager.state.hand):
-            x = start_x + i * (card_width + card_spacing)
-            y = 40
-            
+        # Draw card backgrounds, collecting their text for one batched blit
+        hand = self.deck_manager.state.hand
+        self._update_card_layout()
+        for i, (card_rect, card) in enumerate(zip(self._card_rects, hand)):
             # Card background
-            card_rect = pygame.Rect(x, y, card_width, self.height - y - 10)
             pygame.draw.rect(self.surface, 
-                           self.SELECTED_COLOR if card == self.selected_card else self.BACKGROUND_COLOR, 
+                           self.SELECTED_COLOR if card is self.selected_card else self.BACKGROUND_COLOR, 
                            card_rect)
             pygame.draw.rect(self.surface, self.BORDER_COLOR, card_rect, 1)
             
             # Hotkey number (1-5)
-            hotkey_text = str(i + 1)
-            hotkey = self.hotkey_font.render(hotkey_text, True, self.HOTKEY_COLOR)
-            hotkey_rect = hotkey.get_rect(left=card_rect.left + 5, top=card_rect.top + 5)
-            self.surface.blit(hotkey, hotkey_rect)
+            blit_seq.append((self._hotkey_surfaces[i], (card_rect.left + 5, card_rect.top + 5)))
             
             # Card name
-            name = self.font.render(card.name, True, self.TEXT_COLOR)
-            name_rect = name.get_rect(centerx=card_rect.centerx, top=card_rect.top + 5)
-            self.surface.blit(name, name_rect)
+            name = self._render(card.name)
+            blit_seq.append((name, (card_rect.centerx - name.get_width() // 2, card_rect.top + 5)))
             
             # Uses remaining
             if card.max_uses > 0:
-                uses_text = f"Uses: {card.max_uses - card.current_uses}/{card.max_uses}"
-                uses = self.font.render(uses_text, True, self.TEXT_COLOR)
-                uses_rect = uses.get_rect(centerx=card_rect.centerx, bottom=card_rect.bottom - 5)
-                self.surface.blit(uses, uses_rect)
+                uses = self._render_uses(card)
+                blit_seq.append((uses, (card_rect.centerx - uses.get_width() // 2,
+                                        card_rect.bottom - 5 - uses.get_height())))
         
-        # Draw to window
-        self.window_surface.blit(self.surface, (self.x, self.y))
+        # One C-level call for all text
+        blit_batch(self.surface, blit_seq)
+                
+    def _update_card_layout(self):
+        """Recompute the card slot rects if the hand size or panel geometry changed."""
+        layout_key = (len(self.deck_manager.state.hand), self.x, self.y, self.width, self.height)
+        if layout_key != self._layout_key:
+            self._recompute_card_layout(layout_key[0])
+            self._layout_key = layout_key
+            
+    def _recompute_card_layout(self, hand_size: int):
+        """
+        Build the rect of each card slot, shared by drawing and hit-testing.
         
-        # Draw tooltip if needed
-        if self.hovered_card and self.tooltip_surface:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            tooltip_x = min(mouse_x + 10, self.window_surface.get_width() - self.tooltip_surface.get_width())
-            tooltip_y = max(mouse_y - self.tooltip_surface.get_height() - 10, 0)
-            self.window_surface.blit(self.tooltip_surface, (tooltip_x, tooltip_y))
+        Args:
+            hand_size: Number of cards in hand
+        """
+        step = self.CARD_WIDTH + self.CARD_SPACING
+        start_x = (self.width - step * hand_size) // 2
+        card_height = self.height - self.CARD_TOP - self.CARD_BOTTOM_MARGIN
+        self._card_xs = list(range(start_x, start_x + step * hand_size, step))
+        self._card_rects = [
+            pygame.Rect(x, self.CARD_TOP, self.CARD_WIDTH, card_height)
+            for x in self._card_xs
+        ]
+        self._card_rects_screen = [rect.move(self.x, self.y) for rect in self._card_rects]
+        
+        # Window-space extent of the whole hand row, for rejecting misses before indexing
+        self._hand_bbox_screen = pygame.Rect(self.x + start_x, self.y + self.CARD_TOP,
+                                             max(0, step * hand_size - self.CARD_SPACING), card_height)
+        
+    def _get_card_at(self, mouse_x: int, mouse_y: int) -> Card | None:
+        """
+        Find the card under a window-space position.
+        
+        Args:
+            mouse_x: X position in window coordinates
+            mouse_y: Y position in window coordinates
+            
+        Returns:
+            Card | None: The card under the position, if any
+        """
+        self._update_card_layout()
+        if not self._hand_bbox_screen.collidepoint(mouse_x, mouse_y):
+            return None
+            
+        # Slots are evenly spaced, so the candidate index follows from x alone;
+        # the slot rect check then rejects positions in the gaps between cards
+        index = (mouse_x - self._hand_bbox_screen.left) // (self.CARD_WIDTH + self.CARD_SPACING)
+        if self._card_rects_screen[index].collidepoint(mouse_x, mouse_y):
+            return self.deck_manager.state.hand[index]
+        return None
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -149,76 +304,62 @@ class HandPanel:
             return False
             
         if event.type == pygame.MOUSEMOTION:
-            # Convert mouse position to panel coordinates
-            mouse_x, mouse_y = event.pos
-            if mouse_y < self.y:  # Mouse above panel
+            self._last_mouse_pos = event.pos
+            
+            # Ignore motion outside the panel before doing any hit-testing
+            if not self.rect.collidepoint(event.pos):
                 self.hovered_card = None
                 return False
                 
-            # Calculate card positions
-            card_spacing = 20
-            card_width = 120
-            start_x = (self.width - (card_width + card_spacing) * len(self.deck_manager.state.hand)) // 2
-            
             # Check if mouse is over a card
-            for i, card in enumerate(self.deck_manager.state.hand):
-                x = start_x + i * (card_width + card_spacing)
-                card_rect = pygame.Rect(x, 40, card_width, self.height - 50)
-                
-                if card_rect.collidepoint(mouse_x - self.x, mouse_y - self.y):
-                    if self.hovered_card != card:
-                        self.hovered_card = card
-                        self._update_tooltip()
-                    return True
+            card = self._get_card_at(*event.pos) if self.deck_manager.state.hand else None
+            if card:
+                if self.hovered_card is not card:
+                    self.hovered_card = card
+                    self._update_tooltip()
+                return True
             
             self.hovered_card = None
             return True
             
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            # Only handle left click (button 1) for card selection/deselection
-            if event.button != 1:
+            # Only handle left clicks (button 1) inside the panel
+            if event.button != 1 or not self.rect.collidepoint(event.pos):
                 return False
                 
-            # Convert mouse position to panel coordinates
-            mouse_x, mouse_y = event.pos
-            if mouse_y < self.y:  # Click above panel - ignore it
-                return False
-                
-            # Calculate card positions
-            card_spacing = 20
-            card_width = 120
-            start_x = (self.width - (card_width + card_spacing) * len(self.deck_manager.state.hand)) // 2
-            
-            # Check if click was on a card
-            for i, card in enumerate(self.deck_manager.state.hand):
-                x = start_x + i * (card_width + card_spacing)
-                card_rect = pygame.Rect(x, 40, card_width, self.height - 50)
-                
-                if card_rect.collidepoint(mouse_x - self.x, mouse_y - self.y):
-                    self.selected_card = card
-                    return True
+            # Check if click was on a card; with an empty hand there is nothing to hit
+            card = self._get_card_at(*event.pos) if self.deck_manager.state.hand else None
+            if card:
+                self.selected_card = card
+                self._dirty = True
+                return True
             
-            # Only deselect if clicking in empty space within the panel
-            if mouse_y >= self.y:
+            # Clicking empty space within the panel deselects
+            if self.selected_card is not None:
                 self.selected_card = None
+                self._dirty = True
             return True
             
         elif event.type == pygame.KEYDOWN:
             # Handle number keys 1-5 for card selection
-            if event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5]:
+            if event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5):
                 # Convert key to index (0-4)
                 index = event.key - pygame.K_1
-                if index < len(self.deck_manager.state.hand):
-                    self.selected_card = self.deck_manager.state.hand[index]
+                hand = self.deck_manager.state.hand
+                if index < len(hand):
+                    self.selected_card = hand[index]
+                    self._dirty = True
                     return True
             
             if event.key == pygame.K_SPACE and self.selected_card:
                 # Try to use selected card
                 if self.deck_manager.use_card(self.selected_card):
                     self.selected_card = None
+                self._dirty = True
                 return True
             elif event.key == pygame.K_d:  # Draw card
                 self.deck_manager.draw_hand()
+                self._dirty = True
                 return True
                 
         return False
@@ -234,6 +375,12 @@ class HandPanel:
             self.tooltip_surface = None
             return
             
+        # Tooltip content never changes for a card (uses are not shown), so reuse it
+        cached = self._tooltip_cache.get(self.hovered_card.id)
+        if cached is not None:
+            self.tooltip_surface = cached
+            return
+            
         # Create tooltip content
         lines = [
             self.hovered_card.name,
@@ -252,7 +399,7 @@ class HandPanel:
         
         for line in lines:
             if line:
-                rendered = self.font.render(line, True, self.TEXT_COLOR)
+                rendered = self._render(line)
                 rendered_lines.append(rendered)
                 max_width = max(max_width, rendered.get_width())
             else:
@@ -272,7 +419,9 @@ class HandPanel:
             if rendered:
                 text_rect = rendered.get_rect(left=padding, top=y)
                 self.tooltip_surface.blit(rendered, text_rect)
-            y += line_height 
+            y += line_height
+            
+        self._tooltip_cache[self.hovered_card.id] = self.tooltip_surface
 
     def set_activity_log_width(self, width: int):
         """Update the activity log width and adjust panel dimensions."""
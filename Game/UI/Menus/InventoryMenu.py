@@ -4,15 +4,35 @@ Inventory menu implementation for managing cards and deck building.
 
 import pygame
 import logging
+import functools
+from collections import Counter
+from Engine.Core.Utils.Blitting import blit_batch
 from Engine.UI.MenuSystem.Menu import Menu
 from Engine.UI.MenuSystem.MenuTypes import MenuID, MenuItemType
 from Game.Content.Cards.CardLoader import CardLoader
 from Game.Content.Cards.InventoryManager import InventoryManager
 from Game.Content.Cards.DeckManager import DeckManager
 from Game.UI.Menus.MenuConfigs import MENU_CONFIGS
+from Game.UI.FontRegistry import FontRegistry
 
 logger = logging.getLogger(__name__)
 
+SYMBOL_FONT_PATH = "Game/Content/Assets/Fonts/segoeuisymbol.ttf"
+
+@functools.lru_cache(maxsize=4)
+def _unicode_supported(font_path: str, size: int) -> bool:
+    """
+    Check whether a font can render the rarity glyphs.
+    
+    The answer depends only on the font file, so it is probed once per
+    process instead of every time an inventory menu is built.
+    """
+    try:
+        # Measuring the glyphs answers the same question without rasterizing them
+        return FontRegistry.get(font_path, size).size('◆★')[0] > 0
+    except (pygame.error, OSError):  # Font missing or unreadable
+        return False
+
 class InventoryMenu(Menu):
     """
     Implements the inventory menu system for managing cards and deck building.
@@ -26,6 +46,10 @@ class InventoryMenu(Menu):
     SELECTED_COLOR = (60, 60, 100)
     BORDER_COLOR = (80, 80, 80)
     
+    # Panel indices for selected_panel, scroll_offset and the panel surfaces
+    LEFT_PANEL = 0   # Available cards
+    RIGHT_PANEL = 1  # Current deck
+    
     # Rarity colors
     RARITY_COLORS = {
         'COMMON': (200, 200, 200),    # White
@@ -53,8 +77,8 @@ class InventoryMenu(Menu):
         config = MENU_CONFIGS[MenuID.INVENTORY]
         super().__init__(
             title="Inventory",
-            font_large=pygame.font.Font("Game/Content/Assets/Fonts/segoeuisymbol.ttf", 36),
-            font_small=pygame.font.Font("Game/Content/Assets/Fonts/segoeuisymbol.ttf", 24),
+            font_large=FontRegistry.get(SYMBOL_FONT_PATH, 36),
+            font_small=FontRegistry.get(SYMBOL_FONT_PATH, 24),
             position="center"
         )
         
@@ -62,13 +86,14 @@ class InventoryMenu(Menu):
         self.config = config
         self.is_visible = False
         
-        # Initialize dimensions based on window size
+        # Initialize dimensions (and the reusable surfaces) based on window size
+        self._surface_sizes = None
         self.update_dimensions()
         
         # Track selected items
         self.selected_card = None
-        self.selected_panel = 'left'  # 'left' or 'right'
-        self.scroll_offset = {'left': 0, 'right': 0}
+        self.selected_panel = self.LEFT_PANEL  # LEFT_PANEL or RIGHT_PANEL
+        self.scroll_offset = [0, 0]  # Indexed by panel
         
         # Initialize managers
         self.inventory = InventoryManager.get_instance()
@@ -76,21 +101,64 @@ class InventoryMenu(Menu):
         
         # Card data
         self.available_cards = []  # Will be populated by refresh_cards
+        self._inventory_version = -1  # Inventory version available_cards was built from
         self.deck_cards = []       # Will be populated by refresh_cards
+        self._deck_counts = Counter()  # Copies of each card id in deck_cards
+        
+        # The composed menu surface is reused until something shown in the menu changes
+        self._dirty = True
         
         # Test Unicode support
-        try:
-            test_surface = self.font_small.render('◆★', True, self.TEXT_COLOR)
-            test_rect = test_surface.get_rect()
-            self.unicode_supported = test_rect.width > 0
-        except:
-            self.unicode_supported = False
+        self.unicode_supported = _unicode_supported(SYMBOL_FONT_PATH, 24)
+        if not self.unicode_supported:
             self.RARITY_SYMBOLS = {
                 'COMMON': '*',      # Asterisk
                 'UNCOMMON': '+',    # Plus
                 'RARE': '#',        # Hash
                 'LEGENDARY': '@'    # Star
             }
+            
+        # Rendered text (the inherited _text_cache) is cleared when the card lists are refreshed
+        self._uses_cache: dict[tuple[int, int], pygame.Surface] = {}  # Uses text keyed by (current, max)
+        self._details_cache: dict[int, tuple[pygame.Surface, ...]] = {}  # Bottom panel lines by card id
+        self._deck_title_surface = None  # "Current Deck (n/20)" title
+        self._deck_title_count = -1      # Deck size the title was rendered for
+        
+        # Rarity glyphs never change, so render each one once. Rarities share
+        # shapes, so each symbol is rasterized in white once and tinted per rarity.
+        base_glyphs = {
+            symbol: self.font_small.render(symbol, True, (255, 255, 255))
+            for symbol in set(self.RARITY_SYMBOLS.values())
+        }
+        self._rarity_glyph_surfaces = {}
+        for rarity, symbol in self.RARITY_SYMBOLS.items():
+            glyph = base_glyphs[symbol].copy()
+            glyph.fill((*self.RARITY_COLORS.get(rarity, self.TEXT_COLOR), 255), special_flags=pygame.BLEND_RGBA_MULT)
+            self._rarity_glyph_surfaces[rarity] = self._to_display_format(glyph)
+
+    def _render_uses(self, card) -> pygame.Surface:
+        """
+        Get the "current/max" uses surface for a card.
+        
+        Keyed by the card's use counters so the string is only formatted
+        when a (current, max) pair is seen for the first time.
+        """
+        key = (card.current_uses, card.max_uses)
+        surface = self._uses_cache.get(key)
+        if surface is None:
+            surface = self._render_text(self.font_small, f"{card.current_uses}/{card.max_uses}", self.TEXT_COLOR)
+            self._uses_cache[key] = surface
+        return surface
+
+    def _get_deck_title(self) -> pygame.Surface:
+        """Get the deck panel title, re-rendering it only when the deck size changes."""
+        deck_size = len(self.deck_cards)
+        if deck_size != self._deck_title_count:
+            self._deck_title_surface = self._to_display_format(self.font_large.render(
+                f"Current Deck ({deck_size}/20)", True, self.TEXT_COLOR  # Use original text color
+            ))
+            self._deck_title_count = deck_size
+        return self._deck_title_surface
 
     def update_dimensions(self):
         """Update menu dimensions based on window size."""
@@ -112,6 +180,32 @@ class InventoryMenu(Menu):
         self.panel_width = (self.window_width - 30) // 2  # 15px padding on sides
         self.panel_height = self.window_height - 120  # Space for bottom panel
         self.bottom_panel_height = 90
+        
+        # Reuse the menu and panel surfaces across frames; reallocate only on a real resize
+        surface_sizes = (self.window_width, self.window_height, self.panel_width, self.panel_height)
+        if surface_sizes != self._surface_sizes:
+            # Row counts and positions only depend on the panel size. Rows start
+            # at y=50, 30px apart. A row is drawn if it starts above
+            # panel_height - 30; scrolling keeps the selection within the list area.
+            self.visible_rows = max(0, -(-(self.panel_height - 80) // 30))  # ceil division
+            self.scroll_rows = (self.panel_height - 50) // 30
+            self._row_positions = [50 + i * 30 for i in range(self.visible_rows)]
+            self._uses_right = self.panel_width - 10  # Right edge uses text is aligned to
+            
+            self._menu_surface = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
+            self._panel_surfaces = (
+                pygame.Surface((self.panel_width, self.panel_height)),
+                pygame.Surface((self.panel_width, self.panel_height))
+            )
+            self._bottom_surface = pygame.Surface((self.window_width - 20, self.bottom_panel_height))
+            
+            # Match the display's pixel format so blits take SDL's fast paths
+            if pygame.display.get_surface() is not None:
+                self._menu_surface = self._menu_surface.convert_alpha()
+                self._panel_surfaces = tuple(surface.convert() for surface in self._panel_surfaces)
+                self._bottom_surface = self._bottom_surface.convert()
+            self._surface_sizes = surface_sizes
+            self._dirty = True
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -130,6 +224,11 @@ class InventoryMenu(Menu):
                 return True
             return False
             
+        # Input while the menu is open may change what it shows, whether this menu
+        # handles it or not (e.g. a card used from the hand panel changes its uses)
+        if event.type != pygame.MOUSEMOTION:
+            self._dirty = True
+            
         # Handle window resize
         if event.type == pygame.VIDEORESIZE:
             self.update_dimensions()
@@ -141,12 +240,12 @@ class InventoryMenu(Menu):
                 self.hide()
                 return True
             elif event.key == pygame.K_LEFT:
-                self.selected_panel = 'left'
+                self.selected_panel = self.LEFT_PANEL
                 if self.selected_card is None and self.available_cards:
                     self.selected_card = 0
                 return True
             elif event.key == pygame.K_RIGHT:
-                self.selected_panel = 'right'
+                self.selected_panel = self.RIGHT_PANEL
                 if self.selected_card is None and self.deck_cards:
                     self.selected_card = 0
                 return True
@@ -162,9 +261,13 @@ class InventoryMenu(Menu):
                 
         return False
 
+    def _panel_cards(self, panel: int) -> list:
+        """Get the card list shown in a panel."""
+        return (self.available_cards, self.deck_cards)[panel]
+
     def _handle_up_key(self):
         """Handle up key navigation."""
-        cards = self.available_cards if self.selected_panel == 'left' else self.deck_cards
+        cards = self._panel_cards(self.selected_panel)
         if cards and self.selected_card is not None and self.selected_card > 0:
             self.selected_card -= 1
             # Adjust scroll if needed
@@ -173,7 +276,7 @@ class InventoryMenu(Menu):
 
     def _handle_down_key(self):
         """Handle down key navigation."""
-        cards = self.available_cards if self.selected_panel == 'left' else self.deck_cards
+        cards = self._panel_cards(self.selected_panel)
         if not cards:
             return
         if self.selected_card is None:
@@ -181,23 +284,23 @@ class InventoryMenu(Menu):
         elif self.selected_card < len(cards) - 1:
             self.selected_card += 1
             # Adjust scroll if needed
-            visible_cards = (self.panel_height - 50) // 30
-            if self.selected_card >= self.scroll_offset[self.selected_panel] + visible_cards:
-                self.scroll_offset[self.selected_panel] = self.selected_card - visible_cards + 1
+            if self.selected_card >= self.scroll_offset[self.selected_panel] + self.scroll_rows:
+                self.scroll_offset[self.selected_panel] = self.selected_card - self.scroll_rows + 1
 
     def _handle_enter_key(self):
         """Handle enter key selection."""
         if self.selected_card is not None:
             # Handle card selection/transfer between panels
-            if self.selected_panel == 'left' and len(self.deck_cards) < 20:
+            if self.selected_panel == self.LEFT_PANEL and len(self.deck_cards) < 20:
                 card = self.available_cards[self.selected_card]
                 # Check if we have enough copies of this card
                 card_stack = self.inventory.cards[card.id]
-                deck_count = sum(1 for c in self.deck_cards if c.id == card.id)
-                if deck_count < card_stack.quantity:
+                if self._deck_counts[card.id] < card_stack.quantity:
                     self.deck_cards.append(card)
-            elif self.selected_panel == 'right' and self.selected_card < len(self.deck_cards):
-                self.deck_cards.pop(self.selected_card)
+                    self._deck_counts[card.id] += 1
+            elif self.selected_panel == self.RIGHT_PANEL and self.selected_card < len(self.deck_cards):
+                removed = self.deck_cards.pop(self.selected_card)
+                self._deck_counts[removed.id] -= 1
                 if self.selected_card >= len(self.deck_cards):
                     self.selected_card = max(0, len(self.deck_cards) - 1) if self.deck_cards else None
 
@@ -205,6 +308,7 @@ class InventoryMenu(Menu):
         """Show the inventory menu."""
         self.is_visible = True
         self.refresh_cards()
+        self._dirty = True
         
     def hide(self):
         """Hide the inventory menu and save deck changes."""
@@ -226,12 +330,19 @@ class InventoryMenu(Menu):
     def refresh_cards(self):
         """Refresh the card displays in both panels."""
         try:
-            logger.debug("Loading cards from inventory...")
-            # Always reload available cards to get current quantities
-            self.available_cards = [
-                stack.card for stack in self.inventory.cards.values()
-            ]
-            logger.debug(f"Loaded {len(self.available_cards)} cards")
+            # Card names and uses may have changed since the last time the menu was open
+            self._text_cache.clear()
+            self._details_cache.clear()
+            
+            # Quantities are read from the inventory when drawing, so the card
+            # list only needs rebuilding when stacks were added or removed
+            if self.inventory.version != self._inventory_version:
+                logger.debug("Loading cards from inventory...")
+                self.available_cards = [
+                    stack.card for stack in self.inventory.cards.values()
+                ]
+                self._inventory_version = self.inventory.version
+                logger.debug(f"Loaded {len(self.available_cards)} cards")
             
             # Load current deck if empty
             if not self.deck_cards and self.deck_manager.state.deck_list:
@@ -247,21 +358,26 @@ class InventoryMenu(Menu):
             
             # Validate deck cards against inventory
             valid_deck_cards = []
+            valid_counts = Counter()
             for card in self.deck_cards:
                 if card.id in self.inventory.cards:
-                    # Count how many of this card are already in the valid deck
-                    deck_count = sum(1 for c in valid_deck_cards if c.id == card.id)
                     # Only keep the card if we haven't exceeded the inventory quantity
-                    if deck_count < self.inventory.cards[card.id].quantity:
+                    if valid_counts[card.id] < self.inventory.cards[card.id].quantity:
                         valid_deck_cards.append(card)
+                        valid_counts[card.id] += 1
             
             # Update deck with valid cards
             self.deck_cards = valid_deck_cards
+            self._deck_counts = valid_counts
             
         except Exception as e:
             logger.error(f"Error refreshing cards: {e}")
 
-    def render(self, screen: pygame.Surface, width: int, height: int) -> None:
+    def is_dirty(self) -> bool:
+        """Whether the menu will recompose its surface on the next render."""
+        return self.is_visible and self._dirty
+
+    def render(self, screen: pygame.Surface, width: int, height: int) -> pygame.Rect | None:
         """
         Render the inventory menu.
         
@@ -269,108 +385,134 @@ class InventoryMenu(Menu):
             screen: The surface to render to
             width: Screen width
             height: Screen height
+            
+        Returns:
+            pygame.Rect | None: Screen area covered by the menu, suitable for
+            pygame.display.update(), or None if the menu is hidden
         """
         if not self.is_visible:
-            return
+            return None
             
         # Update dimensions based on current screen size
         self._update_dimensions_from_size(width, height)
-            
-        # Create menu surface
-        menu_surface = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
-        menu_surface.fill(self.BACKGROUND_COLOR)  # Use original background color
-        
-        # Draw left panel (Available Cards)
-        self._render_card_panel(menu_surface, 'left')
         
-        # Draw right panel (Current Deck)
-        self._render_card_panel(menu_surface, 'right')
-        
-        # Draw bottom panel (Card Details)
-        self._render_bottom_panel(menu_surface)
+        # Only recompose the menu when its contents or size changed
+        if self._dirty:
+            # Clear the reused menu surface
+            menu_surface = self._menu_surface
+            menu_surface.fill(self.BACKGROUND_COLOR)  # Use original background color
+            
+            # Render the left (Available Cards), right (Current Deck) and bottom
+            # (Card Details) panels, then compose them in one batched blit
+            blit_batch(menu_surface, [
+                self._render_card_panel(self.LEFT_PANEL),
+                self._render_card_panel(self.RIGHT_PANEL),
+                self._render_bottom_panel()
+            ])
+            
+            self._dirty = False
         
         # Blit menu to screen at centered position
-        screen.blit(menu_surface, (self.window_x, self.window_y))
+        return screen.blit(self._menu_surface, (self.window_x, self.window_y))
 
-    def _render_card_panel(self, surface: pygame.Surface, panel: str):
-        """Render a card panel (left or right)."""
-        is_left = panel == 'left'
-        cards = self.available_cards if is_left else self.deck_cards
+    def _render_card_panel(self, panel: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Render a card panel (left or right).
+        
+        Args:
+            panel: LEFT_PANEL or RIGHT_PANEL
+            
+        Returns:
+            tuple: The panel surface and its position on the menu surface
+        """
+        is_left = panel == self.LEFT_PANEL
+        cards = self._panel_cards(panel)
         x = 10 if is_left else self.panel_width + 20
         
         # Draw panel background
-        panel_surface = pygame.Surface((self.panel_width, self.panel_height))
+        panel_surface = self._panel_surfaces[panel]
         panel_surface.fill(self.PANEL_COLOR)  # Use original panel color
         pygame.draw.rect(panel_surface, self.BORDER_COLOR, (0, 0, self.panel_width, self.panel_height), 2)
         
         # Draw title
-        title_text = "Available Cards" if is_left else f"Current Deck ({len(self.deck_cards)}/20)"
-        title = self.font_large.render(title_text, True, self.TEXT_COLOR)  # Use original text color
-        panel_surface.blit(title, (10, 10))
+        title = self._render_text(self.font_large, "Available Cards", self.TEXT_COLOR) if is_left else self._get_deck_title()
+        blit_seq = [(title, (10, 10))]
         
-        # Draw cards
-        y_offset = 50
-        for i, card in enumerate(cards[self.scroll_offset[panel]:]):
-            if y_offset >= self.panel_height - 30:
-                break
-                
+        # Draw only the rows that fit, collecting their text for one batched blit
+        first = self.scroll_offset[panel]
+        selected = self.selected_card - first if self.selected_panel == panel and self.selected_card is not None else -1
+        for i, (card, y_offset) in enumerate(zip(cards[first:first + self.visible_rows], self._row_positions)):
             # Draw selection highlight
-            if self.selected_panel == panel and i + self.scroll_offset[panel] == self.selected_card:
+            if i == selected:
                 pygame.draw.rect(panel_surface, self.SELECTED_COLOR,  # Use original selected color
                                (5, y_offset, self.panel_width - 10, 25))
             
             # Draw card info
-            self._render_card_info(panel_surface, card, y_offset, is_left)
-            y_offset += 30
+            self._render_card_info(blit_seq, card, y_offset, is_left)
             
-        surface.blit(panel_surface, (x, 10))
+        blit_batch(panel_surface, blit_seq)
+        return panel_surface, (x, 10)
 
-    def _render_card_info(self, surface: pygame.Surface, card, y_offset: int, is_left: bool):
-        """Render card information in a panel."""
+    def _render_card_info(self, blit_seq: list, card, y_offset: int, is_left: bool):
+        """Queue the blits for a card's row in a panel."""
         # Draw rarity symbol
-        rarity_color = self.RARITY_COLORS.get(card.rarity.name, self.TEXT_COLOR)
-        rarity_symbol = self.font_small.render(self.RARITY_SYMBOLS[card.rarity.name], True, rarity_color)
-        surface.blit(rarity_symbol, (10, y_offset))
+        blit_seq.append((self._rarity_glyph_surfaces[card.rarity.name], (10, y_offset)))
         
         # Draw name and quantity
         if is_left:
             total_quantity = self.inventory.cards[card.id].quantity
-            used_in_deck = sum(1 for c in self.deck_cards if c.id == card.id)
-            remaining = total_quantity - used_in_deck
+            remaining = total_quantity - self._deck_counts[card.id]
             name_text = f" {card.name} ({remaining}/{total_quantity})"
         else:
             name_text = f" {card.name}"
             
-        name = self.font_small.render(name_text, True, self.TEXT_COLOR)  # Use original text color
-        surface.blit(name, (30, y_offset))
+        blit_seq.append((self._render_text(self.font_small, name_text, self.TEXT_COLOR), (30, y_offset)))
         
         # Draw uses if limited
         if card.max_uses > 0:
-            uses_text = f"{card.current_uses}/{card.max_uses}"
-            uses = self.font_small.render(uses_text, True, self.TEXT_COLOR)  # Use original text color
-            uses_rect = uses.get_rect(right=self.panel_width - 10, top=y_offset)
-            surface.blit(uses, uses_rect)
+            uses = self._render_uses(card)
+            blit_seq.append((uses, (self._uses_right - uses.get_width(), y_offset)))
+
+    def _get_card_details(self, card) -> tuple[pygame.Surface, pygame.Surface, pygame.Surface]:
+        """
+        Get the name, description and stats lines shown for a card.
+        
+        Args:
+            card: The card to describe
+            
+        Returns:
+            tuple: The rendered name, description and stats surfaces
+        """
+        details = self._details_cache.get(card.id)
+        if details is None:
+            duration = 'Permanent' if card.effect.duration == -1 else f'{int(card.effect.duration)}s'
+            details = tuple(self._to_display_format(surface) for surface in (
+                self.font_small.render(card.name, True, self.TEXT_COLOR),  # Use original text color
+                self.font_small.render(card.description, True, self.TEXT_COLOR),
+                self.font_small.render(
+                    f"Success: {int(card.effect.success_rate * 100)}% | Duration: {duration}",
+                    True, self.TEXT_COLOR
+                )
+            ))
+            self._details_cache[card.id] = details
+        return details
 
-    def _render_bottom_panel(self, surface: pygame.Surface):
-        """Render the bottom panel with card details."""
-        panel_surface = pygame.Surface((self.window_width - 20, self.bottom_panel_height))
+    def _render_bottom_panel(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Render the bottom panel with card details.
+        
+        Returns:
+            tuple: The panel surface and its position on the menu surface
+        """
+        panel_surface = self._bottom_surface
         panel_surface.fill(self.PANEL_COLOR)  # Use original panel color
         pygame.draw.rect(panel_surface, self.BORDER_COLOR,  # Use original border color
                         (0, 0, self.window_width - 20, self.bottom_panel_height), 2)
         
         if self.selected_card is not None:
-            cards = self.available_cards if self.selected_panel == 'left' else self.deck_cards
+            cards = self._panel_cards(self.selected_panel)
             if 0 <= self.selected_card < len(cards):
-                card = cards[self.selected_card]
-                name = self.font_small.render(card.name, True, self.TEXT_COLOR)  # Use original text color
-                desc = self.font_small.render(card.description, True, self.TEXT_COLOR)  # Use original text color
-                stats = self.font_small.render(
-                    f"Success: {int(card.effect.success_rate * 100)}% | Duration: {'Permanent' if card.effect.duration == -1 else f'{int(card.effect.duration)}s'}", 
-                    True, self.TEXT_COLOR  # Use original text color
-                )
-                
-                panel_surface.blit(name, (10, 10))
-                panel_surface.blit(desc, (10, 35))
-                panel_surface.blit(stats, (10, 60))
+                name, desc, stats = self._get_card_details(cards[self.selected_card])
+                blit_batch(panel_surface, ((name, (10, 10)), (desc, (10, 35)), (stats, (10, 60))))
                 
-        surface.blit(panel_surface, (10, self.window_height - self.bottom_panel_height - 10)) 
\ No newline at end of file
+        return panel_surface, (10, self.window_height - self.bottom_panel_height - 10) 
\ No newline at end of file
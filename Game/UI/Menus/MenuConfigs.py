@@ -2,6 +2,7 @@
 Menu configuration data including font settings and menu layouts.
 """
 
+from types import MappingProxyType
 from Engine.UI.MenuSystem.MenuTypes import MenuID, MenuItemType
 
 # Fallback chain: Consolas -> System Default
@@ -216,4 +217,18 @@ MENU_CONFIGS = {
             }
         ]
     }
-}
\ No newline at end of file
+}
+
+
+def _freeze(value):
+    """Recursively convert config dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Configs are shared by every menu built from them, so make them read-only once
+# at import; consumers can then hold references without defensive copies
+FONT_CONFIGS = _freeze(FONT_CONFIGS)
+MENU_CONFIGS = _freeze(MENU_CONFIGS)
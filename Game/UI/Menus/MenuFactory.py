@@ -9,6 +9,7 @@ import os
 from Engine.UI.MenuSystem.MenuItem import MenuItem
 from Engine.UI.MenuSystem.MenuTypes import MenuItemType
 from Game.UI.Menus.MenuConfigs import FONT_CONFIGS
+from Game.UI.FontRegistry import FontRegistry
 
 logger = logging.getLogger(__name__)
 logger.debug("Importing MenuFactory module")
@@ -63,7 +64,7 @@ class MenuFactory:
             try:
                 font_path = get_font_path("Game/Content/Assets/Fonts/segoeuisymbol.ttf")
                 if font_path:
-                    return pygame.font.Font(font_path, config["Size"])
+                    return FontRegistry.get(font_path, config["Size"])
             except:
                 pass
                 
@@ -72,7 +73,7 @@ class MenuFactory:
                 return pygame.font.SysFont("arial", config["Size"])
             except:
                 # Last resort - use pygame default
-                return pygame.font.Font(None, config["Size"])
+                return FontRegistry.get(None, config["Size"])
 
         # Create fonts with Unicode support
         self.title_font = create_font(FONT_CONFIGS["Title"])
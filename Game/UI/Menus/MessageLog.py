@@ -2,16 +2,23 @@
 import pygame
 from typing import List
 from collections import deque
+from itertools import islice
 from Engine.Core.Events import EventManager, GameEventType
 from Engine.Core.Utils.GlyphProvider import GlyphProvider
+from Engine.Core.Utils.BoundedCache import BoundedCache
 import logging
 import re
 
+# Color markup wrapping a whole message, e.g. <red>text</red>
+MARKUP_PATTERN = re.compile(r'<(\w+)>(.*?)</\w+>')
+
 class ActivityLog:
     _instance = None
     MAX_MESSAGES = 100  # Maximum number of messages to store
     LINES_PER_PAGE = 5  # Number of lines to scroll for page up/down
     VISIBLE_MESSAGES = 20  # Number of messages to show at once
+    WRAP_CACHE_SIZE = 1024  # Maximum number of wrapped texts kept
+    WORD_WIDTH_CACHE_SIZE = 4096  # Maximum number of measured words kept
 
     def __new__(cls):
         if cls._instance is None:
@@ -29,7 +36,16 @@ class ActivityLog:
             self.scroll_offset = 0  # Number of lines scrolled up from bottom
             self.wrap_width = None
             self.font = None
-            self._wrapped_lines = []
+            self._wrapped_lines = deque()  # Wrapped lines of all messages, oldest first
+            self._lines_per_message = deque(maxlen=self.MAX_MESSAGES)  # Wrapped line count of each message
+            self._wrap_cache = BoundedCache(self.WRAP_CACHE_SIZE)  # Wrapped lines keyed by (text, wrap width, font id)
+            self._word_widths = BoundedCache(self.WORD_WIDTH_CACHE_SIZE)  # Rendered width of each word in the current font
+            self._pending_messages = 0  # Messages added since the log was last wrapped
+            self._needs_reflow = False  # Wrap parameters changed since the last reflow
+            self._header = None  # "Messages (n)" line, rebuilt only when n changes
+            self._header_count = -1
+            self._more_above = f"<yellow>{GlyphProvider.get('ARROW_UP')}</yellow>"
+            self._more_below = f"<yellow>{GlyphProvider.get('ARROW_DOWN')}</yellow>"
             self._initialized = True
 
     @staticmethod
@@ -55,11 +71,48 @@ class ActivityLog:
         self.add_message(message)
 
     def add_message(self, message: str):
-        """Add a new message to the log."""
+        """Add a new message to the log. It is wrapped the next time the log is read."""
         self.messages.append(message)
+        self._pending_messages += 1
         self.logger.debug(f"Added message. Total messages: {len(self.messages)}")
-        if self.wrap_width is not None and self.font is not None:
+
+    def _flush_pending(self) -> None:
+        """
+        Wrap messages added since the last read instead of reflowing the whole log.
+        
+        A burst of messages within one frame is wrapped together, and messages
+        evicted before the log is read are never wrapped at all.
+        """
+        if self._needs_reflow:
             self.reflow_messages()
+            return
+        if not self._pending_messages:
+            return
+        pending = min(self._pending_messages, len(self.messages))
+        self._pending_messages = 0
+        if self.wrap_width is None or self.font is None:
+            return
+
+        try:
+            old_total = len(self._wrapped_lines)
+            
+            # Drop the lines of wrapped messages the deque has since evicted
+            evicted = len(self._lines_per_message) - (len(self.messages) - pending)
+            for _ in range(evicted):
+                for _ in range(self._lines_per_message.popleft()):
+                    self._wrapped_lines.popleft()
+                
+            for i in range(len(self.messages) - pending, len(self.messages)):
+                wrapped = self._wrap_message(self.messages[i])
+                self._wrapped_lines.extend(wrapped)
+                self._lines_per_message.append(len(wrapped))
+            
+            # Keep the scroll offset in range, as a full reflow would
+            new_total = len(self._wrapped_lines)
+            if old_total and old_total != new_total and self.scroll_offset > 0:
+                self.scroll_offset = min(self.scroll_offset, max(0, new_total - self.VISIBLE_MESSAGES))
+        except Exception as e:
+            self.logger.error(f"Error wrapping messages: {e}", exc_info=True)
 
     def scroll(self, amount: int) -> None:
         """
@@ -71,6 +124,7 @@ class ActivityLog:
             amount = (amount // abs(amount)) * self.LINES_PER_PAGE
 
         # Calculate total lines available for scrolling
+        self._flush_pending()
         total_lines = len(self._wrapped_lines) if self._wrapped_lines else len(self.messages)
         
         # Calculate maximum possible scroll offset
@@ -84,7 +138,8 @@ class ActivityLog:
 
     def get_messages(self) -> List[str]:
         """Get all current messages with proper scroll indicators."""
-        messages_to_display = self._wrapped_lines if self._wrapped_lines else list(self.messages)
+        self._flush_pending()
+        messages_to_display = self._wrapped_lines if self._wrapped_lines else self.messages
         if not messages_to_display:
             return ["<white>Messages (0)</white>"]
 
@@ -93,20 +148,21 @@ class ActivityLog:
         start_idx = max(0, total_lines - self.VISIBLE_MESSAGES - self.scroll_offset)
         end_idx = total_lines - self.scroll_offset
 
-        glyphs = GlyphProvider()
-        result = []
-        result.append(f"<white>Messages ({len(self.messages)})</white>")
+        if self._header_count != len(self.messages):
+            self._header_count = len(self.messages)
+            self._header = f"<white>Messages ({self._header_count})</white>"
+        result = [self._header]
 
         # Show up arrow if there are messages above
         if start_idx > 0:
-            result.append(f"<yellow>{glyphs.get('ARROW_UP')}</yellow>")
+            result.append(self._more_above)
 
         # Add visible messages
-        result.extend(messages_to_display[start_idx:end_idx])
+        result.extend(islice(messages_to_display, start_idx, end_idx))
 
         # Show down arrow if there are messages below
         if self.scroll_offset > 0:
-            result.append(f"<yellow>{glyphs.get('ARROW_DOWN')}</yellow>")
+            result.append(self._more_below)
 
         return result
 
@@ -115,28 +171,38 @@ class ActivityLog:
         return "\n".join(self.get_messages())
 
     def set_wrap_params(self, wrap_width: int, font: 'pygame.font.Font') -> None:
-        """Set text wrapping parameters and reflow messages."""
+        """
+        Set text wrapping parameters.
+        
+        Messages are reflowed the next time the log is read, so a drag-resize
+        that changes the width many times per frame reflows only once.
+        """
         if wrap_width != self.wrap_width or font != self.font:
             self.logger.debug(f"Setting wrap width to {wrap_width}")
+            if font is not self.font:
+                # Cached wrappings are keyed by font id, which a new font may reuse
+                self._wrap_cache.clear()
+                self._word_widths.clear()
             self.wrap_width = wrap_width
             self.font = font
-            self.reflow_messages()
+            self._needs_reflow = True
 
     def reflow_messages(self) -> None:
         """Reflow all messages with current wrap parameters."""
+        self._pending_messages = 0  # Every stored message is wrapped below
+        self._needs_reflow = False
         if self.wrap_width is None or self.font is None:
-            self._wrapped_lines = []
+            self._wrapped_lines.clear()
+            self._lines_per_message.clear()
             return
 
         try:
             new_lines = []
+            lines_per_message = deque(maxlen=self.MAX_MESSAGES)
             for message in self.messages:
-                for line in message.splitlines():
-                    wrapped = self._wrap_text(line, self.font, self.wrap_width)
-                    if wrapped:
-                        new_lines.extend(wrapped)
-                    else:
-                        new_lines.append("")
+                wrapped = self._wrap_message(message)
+                new_lines.extend(wrapped)
+                lines_per_message.append(len(wrapped))
             
             # Adjust scroll offset if necessary to maintain relative position
             if self._wrapped_lines:
@@ -149,43 +215,88 @@ class ActivityLog:
                         max(0, new_total - self.VISIBLE_MESSAGES)
                     )
             
-            self._wrapped_lines = new_lines
+            self._wrapped_lines = deque(new_lines)
+            self._lines_per_message = lines_per_message
             self.logger.debug(f"Reflowed {len(self.messages)} messages into {len(new_lines)} lines")
         except Exception as e:
             self.logger.error(f"Error reflowing messages: {e}", exc_info=True)
 
-    def _wrap_text(self, text: str, font: 'pygame.font.Font', wrap_width: int) -> list:
-        """Wrap text to fit within the given width."""
+    def _wrap_message(self, message: str) -> list:
+        """Wrap each line of a message with the current wrap parameters."""
+        lines = []
+        for line in message.splitlines():
+            wrapped = self._wrap_text(line, self.font, self.wrap_width)
+            if wrapped:
+                lines.extend(wrapped)
+            else:
+                lines.append("")
+        return lines
+
+    def _wrap_text(self, text: str, font: 'pygame.font.Font', wrap_width: int) -> tuple:
+        """Wrap text to fit within the given width, reusing earlier results for repeated text."""
+        key = (text, wrap_width, id(font))
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = tuple(self._measure_wrap(text, font, wrap_width))
+            self._wrap_cache.put(key, lines)
+        return lines
+
+    def _measure_wrap(self, text: str, font: 'pygame.font.Font', wrap_width: int) -> list:
+        """Measure text with the font and split it into lines that fit the width."""
         try:
             # Handle color markup
-            markup_pattern = r'<(\w+)>(.*?)</\w+>'
-            match = re.match(markup_pattern, text)
+            match = MARKUP_PATTERN.match(text)
             if match:
                 color, text = match.groups()  # Extract both color and text from markup
+                open_tag, close_tag = f"<{color}>", f"</{color}>"
+            else:
+                open_tag = close_tag = ""
 
             words = text.split()
             if not words:
                 return [""]
 
+            # Measure each distinct word once and estimate line widths by summing
+            # them. Summed widths drift from the real width by under a pixel per
+            # word (kerning, rounding), so only lines within that margin of the
+            # wrap width are measured as a whole.
+            word_widths = self._word_widths
+            widths = []
+            for word in words:
+                width = word_widths.get(word)
+                if width is None:
+                    width = font.size(word)[0]
+                    word_widths.put(word, width)
+                widths.append(width)
+            space_width = font.size(" ")[0]
+
             lines = []
             current_line = words[0]
-            for word in words[1:]:
-                test_line = current_line + " " + word
-                if font.size(test_line)[0] <= wrap_width:
-                    current_line = test_line
+            current_width = widths[0]
+            word_count = 1
+            for word, word_width in zip(words[1:], widths[1:]):
+                width = current_width + space_width + word_width
+                margin = word_count + 2
+                if width + margin <= wrap_width:
+                    fits = True
+                elif width - margin > wrap_width:
+                    fits = False
+                else:
+                    fits = font.size(current_line + " " + word)[0] <= wrap_width
+                    
+                if fits:
+                    current_line += " " + word
+                    current_width = width
+                    word_count += 1
                 else:
                     # Reapply color markup to wrapped lines if it existed
-                    if match:
-                        lines.append(f"<{color}>{current_line}</{color}>")
-                    else:
-                        lines.append(current_line)
+                    lines.append(open_tag + current_line + close_tag)
                     current_line = word
+                    current_width = word_width
+                    word_count = 1
 
             # Don't forget to add the last line with proper markup
-            if match:
-                lines.append(f"<{color}>{current_line}</{color}>")
-            else:
-                lines.append(current_line)
+            lines.append(open_tag + current_line + close_tag)
             return lines
         except Exception as e:
             self.logger.error(f"Error wrapping text: {e}", exc_info=True)
@@ -7,6 +7,8 @@ import logging
 from Engine.UI.MenuSystem.Menu import Menu
 from Engine.UI.MenuSystem.MenuTypes import MenuID
 from Game.UI.Menus.MenuConfigs import MENU_CONFIGS
+from Game.UI.FontRegistry import FontRegistry
+from Engine.Core.Utils.Blitting import blit_batch
 
 logger = logging.getLogger(__name__)
 
@@ -17,9 +19,20 @@ class PauseMenu(Menu):
     
     # Color constants
     BACKGROUND_COLOR = (0, 0, 0, 128)  # Semi-transparent black
+    # Multiplying the screen by this darkens it like blending BACKGROUND_COLOR
+    # over it (within one level per channel), without an overlay surface
+    OVERLAY_SHADE = (255 - BACKGROUND_COLOR[3],) * 3
     TEXT_COLOR = (255, 255, 255)
     SELECTED_COLOR = (100, 100, 255)
     
+    # Keys handled while the menu is open, mapped to the method name handling them
+    KEY_HANDLERS = {
+        pygame.K_ESCAPE: "_close",
+        pygame.K_UP: "_select_previous",
+        pygame.K_DOWN: "_select_next",
+        pygame.K_RETURN: "_activate_selected",
+    }
+    
     def __init__(self, window_surface: pygame.Surface):
         """
         Initialize the pause menu.
@@ -30,8 +43,8 @@ class PauseMenu(Menu):
         config = MENU_CONFIGS[MenuID.PAUSE]
         super().__init__(
             title=config["Title"],
-            font_large=pygame.font.Font(None, 48),
-            font_small=pygame.font.Font(None, 36),
+            font_large=FontRegistry.get(None, 48),
+            font_small=FontRegistry.get(None, 36),
             position="center"
         )
         
@@ -41,9 +54,16 @@ class PauseMenu(Menu):
         
         # Menu state
         self.selected_item = 0
+        self._key_handlers = {key: getattr(self, name) for key, name in self.KEY_HANDLERS.items()}
         self.menu_items = self.config["Items"]
         
+        # The config is frozen, so pull out the fields read on every frame/keypress
+        self._title_text: str = self.config["Title"]
+        self._item_texts: tuple[str, ...] = tuple(item["Text"] for item in self.menu_items)
+        self._item_actions: tuple[str, ...] = tuple(item["Action"] for item in self.menu_items)
+        
         # Update dimensions based on window size
+        self._layout_size = None  # Window size the item positions were computed for
         self.update_dimensions()
         
     def update_dimensions(self):
@@ -54,6 +74,9 @@ class PauseMenu(Menu):
         
     def _update_dimensions_from_size(self, width: int, height: int):
         """Update dimensions based on provided width and height."""
+        if (width, height) == self._layout_size:
+            return
+        self._layout_size = (width, height)
         self.window_width = width
         self.window_height = height
         
@@ -66,6 +89,17 @@ class PauseMenu(Menu):
         self.title_y = center_y - (total_height // 2)
         self.first_item_y = self.title_y + 60  # Title height + spacing
         self.item_spacing = 50
+        
+        # Rects of the title and each item, used every frame until the next resize.
+        # Both colors of an item render to the same size, so one rect serves both.
+        center_x = width // 2
+        title_surface = self._render_text(self.font_large, self._title_text, self.TEXT_COLOR)
+        self._title_rect = title_surface.get_rect(center=(center_x, self.title_y))
+        self._item_rects = [
+            self._render_text(self.font_small, text, self.TEXT_COLOR).get_rect(
+                center=(center_x, self.first_item_y + i * self.item_spacing))
+            for i, text in enumerate(self._item_texts)
+        ]
 
     def show(self):
         """Show the pause menu."""
@@ -94,39 +128,52 @@ class PauseMenu(Menu):
             tuple[bool, str]: (event_handled, action_to_take)
                 action_to_take can be: "", "RESUME", "QUIT"
         """
+        etype = event.type
+        
         # If menu is not visible, only handle ESC to show it
         if not self.is_visible:
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            if etype == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 self.show()
                 return True, ""
             return False, ""
         
         # Handle window resize
-        if event.type == pygame.VIDEORESIZE:
+        if etype == pygame.VIDEORESIZE:
             self.update_dimensions()
             return True, ""
         
         # If menu is visible, handle navigation and actions
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                self.hide()
-                return True, "RESUME"
-            elif event.key == pygame.K_UP:
-                self.selected_item = (self.selected_item - 1) % len(self.menu_items)
-                return True, ""
-            elif event.key == pygame.K_DOWN:
-                self.selected_item = (self.selected_item + 1) % len(self.menu_items)
-                return True, ""
-            elif event.key == pygame.K_RETURN:
-                action = self.menu_items[self.selected_item]["Action"]
-                if action == "ResumeGame":
-                    self.hide()
-                    return True, "RESUME"
-                elif action == "QuitToMain":
-                    return True, "QUIT"
+        if etype == pygame.KEYDOWN:
+            handler = self._key_handlers.get(event.key)
+            if handler:
+                return handler()
                 
         return False, ""
 
+    def _close(self) -> tuple[bool, str]:
+        """Close the menu and resume the game."""
+        self.hide()
+        return True, "RESUME"
+
+    def _select_previous(self) -> tuple[bool, str]:
+        """Move the selection up, wrapping to the last item."""
+        self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+        return True, ""
+
+    def _select_next(self) -> tuple[bool, str]:
+        """Move the selection down, wrapping to the first item."""
+        self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+        return True, ""
+
+    def _activate_selected(self) -> tuple[bool, str]:
+        """Run the action of the selected item."""
+        action = self._item_actions[self.selected_item]
+        if action == "ResumeGame":
+            return self._close()
+        elif action == "QuitToMain":
+            return True, "QUIT"
+        return False, ""
+
     def render(self, screen: pygame.Surface, width: int, height: int) -> None:
         """
         Render the pause menu.
@@ -142,19 +189,17 @@ class PauseMenu(Menu):
         # Update dimensions based on current screen size
         self._update_dimensions_from_size(width, height)
             
-        # Create overlay surface
-        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-        overlay.fill(self.BACKGROUND_COLOR)
-        screen.blit(overlay, (0, 0))
+        # Darken the game behind the menu
+        screen.fill(self.OVERLAY_SHADE, special_flags=pygame.BLEND_MULT)
         
         # Draw title
-        title_surface = self.font_large.render(self.config["Title"], True, self.TEXT_COLOR)
-        title_rect = title_surface.get_rect(center=(width // 2, self.title_y))
-        screen.blit(title_surface, title_rect)
+        title_surface = self._render_text(self.font_large, self._title_text, self.TEXT_COLOR)
+        blit_seq = [(title_surface, self._title_rect)]
         
-        # Draw menu items
-        for i, item in enumerate(self.menu_items):
+        # Draw menu items, collected for one batched blit
+        for i, text in enumerate(self._item_texts):
             color = self.SELECTED_COLOR if i == self.selected_item else self.TEXT_COLOR
-            text_surface = self.font_small.render(item["Text"], True, color)
-            text_rect = text_surface.get_rect(center=(width // 2, self.first_item_y + i * self.item_spacing))
-            screen.blit(text_surface, text_rect) 
\ No newline at end of file
+            text_surface = self._render_text(self.font_small, text, color)
+            blit_seq.append((text_surface, self._item_rects[i]))
+            
+        blit_batch(screen, blit_seq) 
\ No newline at end of file
@@ -22,6 +22,10 @@ class TitleScreen:
         options_menu (Menu): The options menu
     """
     
+    # The title menus are centered menus, which only react to key presses
+    INPUT_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN)
+    TARGET_FPS = 60  # Same cap as the game loop
+    
     def __init__(self, width: int, height: int):
         """
         Initialize the title screen.
@@ -34,6 +38,7 @@ class TitleScreen:
         self.screen = self.window_manager.set_mode(width, height)
         self.width, self.height = self.window_manager.get_screen_size()
         self.state = MenuState.MAIN
+        self._clock = pygame.time.Clock()  # Paces the title screen loop
         
         # Create action handlers with PascalCase names
         self.menu_actions = {
@@ -43,7 +48,7 @@ class TitleScreen:
             "MenuBack": lambda: setattr(self, "state", MenuState.MAIN),
             "ChangeResolution": self._update_resolution,
             "ToggleFullscreen": self._toggle_fullscreen,
-            "GetAvailableResolutions": lambda: [f"{w}x{h}" for w, h in self.window_manager.resolutions],
+            "GetAvailableResolutions": self.window_manager.get_resolution_strs,
             "GetCurrentResolution": self.window_manager.get_resolution_str,
             "GetFullscreenState": lambda: self.window_manager.fullscreen
         }
@@ -57,20 +62,31 @@ class TitleScreen:
         self.main_menu = self.menu_factory.create_menu(MENU_CONFIGS[MenuID.MAIN])
         self.options_menu = self.menu_factory.create_menu(MENU_CONFIGS[MenuID.OPTIONS])
         
+    def _refresh_option_values(self):
+        """
+        Show the current window settings in the options menu.
+        
+        Menus are laid out from the screen size at render time, so after a
+        display change only the selector/toggle values need updating.
+        """
+        for item, item_config in zip(self.options_menu.items, MENU_CONFIGS[MenuID.OPTIONS]["Items"]):
+            if "GetOptions" in item_config:
+                item.options = self.menu_actions[item_config["GetOptions"]]()
+            if "GetCurrent" in item_config:
+                item.value = self.menu_actions[item_config["GetCurrent"]]()
+        
     def _update_resolution(self):
         """Update the screen resolution."""
         self.width, self.height = self.window_manager.cycle_resolution()
         self.screen = self.window_manager.screen
-        # Recreate menus with new dimensions
-        self._create_menus()
+        self._refresh_option_values()
         
     def _toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         self.window_manager.toggle_fullscreen()
         self.width, self.height = self.window_manager.get_screen_size()
         self.screen = self.window_manager.screen
-        # Recreate menus with new dimensions
-        self._create_menus()
+        self._refresh_option_values()
 
     def render(self):
         """Render the current menu."""
@@ -88,15 +104,23 @@ class TitleScreen:
         Returns:
             tuple[bool, dict]: (should_exit, settings)
         """
-        for event in pygame.event.get():
+        # Pace the title loop so it doesn't redraw and pump events flat out
+        self._clock.tick(self.TARGET_FPS)
+        
+        # Fetch only the events the menus use and drop the rest in one go
+        events = pygame.event.get(self.INPUT_EVENT_TYPES)
+        pygame.event.clear()
+        
+        # Bind the handlers once; an event can switch menus, so pick per event
+        main_handle = self.main_menu.handle_input
+        options_handle = self.options_menu.handle_input
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 return True, {}
             
-            result = None
-            if self.state == MenuState.MAIN:
-                result = self.main_menu.handle_input(event)
-            else:
-                result = self.options_menu.handle_input(event)
+            handle = main_handle if self.state == MenuState.MAIN else options_handle
+            result = handle(event)
                 
             if isinstance(result, dict) and result.get('exit'):
                 return True, result
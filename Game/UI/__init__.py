@@ -6,8 +6,10 @@ This package contains game-specific UI elements:
 - Menu configurations
 - Message log
 - HUD elements
+- Shared font registry
 """
 
 from .TitleScreen import TitleScreen
+from .FontRegistry import FontRegistry
 
-__all__ = ['TitleScreen']
+__all__ = ['TitleScreen', 'FontRegistry']
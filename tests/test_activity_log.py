@@ -0,0 +1,166 @@
+"""
+Tests for the activity log's incremental message wrapping.
+"""
+
+import random
+from pathlib import Path
+import pygame
+import pytest
+
+try:
+    from Game.UI.Menus.MessageLog import ActivityLog
+except NameError as e:
+    # Engine.Core imports the zones package, and TileType currently fails to define
+    pytest.skip(f"zone modules cannot be imported: {e}", allow_module_level=True)
+
+WRAP_WIDTH = 120
+FONT_DIR = Path(__file__).resolve().parent.parent / "Game" / "Content" / "Assets" / "Fonts"
+
+@pytest.fixture(scope="module")
+def font():
+    """Create the font messages are wrapped with."""
+    pygame.font.init()
+    return pygame.font.Font(None, 20)
+
+def new_log(font=None) -> ActivityLog:
+    """Create a fresh activity log, bypassing the shared singleton."""
+    ActivityLog._instance = None
+    log = ActivityLog()
+    if font is not None:
+        log.set_wrap_params(WRAP_WIDTH, font)
+    return log
+
+def run_log(font, steps, full_reflow: bool) -> list:
+    """
+    Replay steps against a new log and record its state after every read.
+
+    Args:
+        font: Font messages are wrapped with
+        steps: ("add", message), ("read",) or ("scroll", amount) tuples
+        full_reflow: Reflow every message on each read instead of wrapping
+            only the pending ones
+
+    Returns:
+        list: (visible messages, scroll offset, wrapped lines) after each read
+    """
+    log = new_log(font)
+    states = []
+    for step in steps:
+        if step[0] == "add":
+            log.add_message(step[1])
+            continue
+        if full_reflow:
+            log._needs_reflow = True
+        if step[0] == "scroll":
+            log.scroll(step[1])
+        states.append((log.get_messages(), log.scroll_offset, list(log._wrapped_lines)))
+    return states
+
+def assert_matches_reflow(font, steps):
+    """Check that incremental wrapping gives the same states as full reflows."""
+    assert run_log(font, steps, full_reflow=False) == run_log(font, steps, full_reflow=True)
+
+def multi_line_message(i: int) -> str:
+    """A message long enough to wrap, with an explicit second line."""
+    return f"Goblin {i} attacks the player for {i % 7} damage and then some more\nsecond line {i}"
+
+def test_burst_larger_than_max_messages(font):
+    """Test a burst that evicts wrapped and never-wrapped messages between reads."""
+    steps = [("add", f"message {i}") for i in range(30)] + [("read",)]
+    steps += [("add", multi_line_message(i)) for i in range(ActivityLog.MAX_MESSAGES + 25)]
+    steps += [("read",)]
+    assert_matches_reflow(font, steps)
+
+def test_multi_line_messages(font):
+    """Test messages that wrap and contain newlines, read after every few additions."""
+    steps = []
+    for i in range(ActivityLog.MAX_MESSAGES + 40):
+        steps.append(("add", multi_line_message(i)))
+        steps.append(("add", f"<red>{i} has been slain!</red>"))
+        if i % 3 == 0:
+            steps.append(("read",))
+    assert_matches_reflow(font, steps)
+
+def test_scroll_offset_clamped(font):
+    """Test that evicting long messages clamps a scrolled-up offset."""
+    steps = [("add", multi_line_message(i)) for i in range(ActivityLog.MAX_MESSAGES)]
+    steps += [("scroll", ActivityLog.LINES_PER_PAGE)] * 100  # Scroll to the oldest line
+    steps += [("add", "short") for _ in range(ActivityLog.MAX_MESSAGES + 10)]
+    steps += [("read",)]
+    states = run_log(font, steps, full_reflow=False)
+    assert states == run_log(font, steps, full_reflow=True)
+
+    # Only single-line messages remain, so the offset must have been clamped
+    _, offset, lines = states[-1]
+    assert len(lines) == ActivityLog.MAX_MESSAGES
+    assert offset == ActivityLog.MAX_MESSAGES - ActivityLog.VISIBLE_MESSAGES
+
+def test_messages_added_before_wrap_params(font):
+    """Test that messages added before wrapping is configured are wrapped on first read."""
+    log = new_log()
+    for i in range(5):
+        log.add_message(multi_line_message(i))
+    assert log.get_messages()[1:] == list(log.messages)  # Shown unwrapped until configured
+
+    log.set_wrap_params(WRAP_WIDTH, font)
+    messages = log.get_messages()
+    expected = [line for message in log.messages for line in log._wrap_message(message)]
+    assert len(expected) > ActivityLog.VISIBLE_MESSAGES  # Each message wrapped onto several lines
+    assert list(log._wrapped_lines) == expected
+    assert messages[0] == "<white>Messages (5)</white>"
+    assert messages[-ActivityLog.VISIBLE_MESSAGES:] == expected[-ActivityLog.VISIBLE_MESSAGES:]
+
+def test_scroll_sees_pending_messages(font):
+    """Test that scrolling counts messages that have not been wrapped yet."""
+    log = new_log(font)
+    log.add_message("first")
+    log.get_messages()  # Wrapped lines now fit on screen, leaving nothing to scroll
+    for i in range(ActivityLog.VISIBLE_MESSAGES + 10):
+        log.add_message(f"message {i}")
+
+    log.scroll(3)  # Nothing has read the log since the messages were added
+    assert log.scroll_offset == 3
+    assert log.get_messages()[-2] == f"message {ActivityLog.VISIBLE_MESSAGES + 6}"
+
+def measure_each_line(text: str, font: pygame.font.Font, wrap_width: int) -> list:
+    """Reference wrapping that measures every candidate line with the font."""
+    words = text.split()
+    if not words:
+        return [""]
+    lines = []
+    current_line = words[0]
+    for word in words[1:]:
+        test_line = current_line + " " + word
+        if font.size(test_line)[0] <= wrap_width:
+            current_line = test_line
+        else:
+            lines.append(current_line)
+            current_line = word
+    lines.append(current_line)
+    return lines
+
+@pytest.mark.parametrize("font_file,size", [
+    (None, 20),
+    (None, 14),
+    ("segoeuisymbol.ttf", 16),
+    ("consolas.ttf", 15),
+])
+def test_measure_wrap_matches_measuring_each_line(font_file, size):
+    """Test that wrapping from summed word widths breaks lines exactly like measuring each line."""
+    pygame.font.init()
+    font = pygame.font.Font(str(FONT_DIR / font_file) if font_file else None, size)
+    log = new_log(font)
+    words = ("Goblin Player attacks for 12 damage! has been slain Rat Wolf AV To WA "
+             "a very-long-hyphenated-word-that-needs-its-own-line 3 ♥ △ !!!").split()
+    rng = random.Random(size)
+    for _ in range(3000):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 30)))
+        wrap_width = rng.randint(50, 400)
+        assert log._measure_wrap(text, font, wrap_width) == measure_each_line(text, font, wrap_width), (text, wrap_width)
+
+def test_word_width_cache_is_bounded(font):
+    """Test that measuring ever-new words (damage numbers, names) keeps the width cache bounded."""
+    log = new_log(font)
+    text = " ".join(str(i) for i in range(ActivityLog.WORD_WIDTH_CACHE_SIZE + 500))
+    assert log._measure_wrap(text, font, WRAP_WIDTH) == measure_each_line(text, font, WRAP_WIDTH)
+    assert len(log._word_widths) == ActivityLog.WORD_WIDTH_CACHE_SIZE
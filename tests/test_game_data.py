@@ -0,0 +1,34 @@
+"""
+Tests for faction disposition changes in the game data.
+"""
+
+import pytest
+from Game.Content.Data.GameData import GameData
+
+@pytest.fixture
+def game_data(monkeypatch):
+    """Create a fresh GameData, bypassing the shared singleton."""
+    monkeypatch.setattr(GameData, "_instance", None)
+    monkeypatch.setattr(GameData, "_initialized", False)
+    return GameData()
+
+def test_modify_adds_new_faction_pair(game_data):
+    """Test that a pair with no loaded relation starts from a neutral disposition."""
+    game_data.modify_faction_dispositions([("test_rebels", "test_guards", -30)])
+    assert game_data._relations["test_rebels"] == {"test_guards": -30}
+    assert game_data.get_faction_disposition("test_rebels", "test_guards") == -30
+
+def test_modify_accumulates_and_clamps(game_data):
+    """Test that repeated changes accumulate and stay within [-100, 100]."""
+    game_data.modify_faction_dispositions([
+        ("test_rebels", "test_guards", -60),
+        ("test_rebels", "test_guards", -60),
+        ("test_rebels", "test_traders", 70),
+        ("test_rebels", "test_traders", 70),
+        ("test_guards", "test_traders", 40),
+    ])
+    assert game_data._relations["test_rebels"] == {"test_guards": -100, "test_traders": 100}
+    assert game_data._relations["test_guards"]["test_traders"] == 40
+
+    game_data.modify_faction_dispositions([("test_rebels", "test_guards", 30)])
+    assert game_data._relations["test_rebels"]["test_guards"] == -70